@@ -50,6 +50,10 @@ class Settings(BaseSettings):
     excel_recalc_enabled: bool = True
     excel_recalc_timeout_seconds: int = 45
     excel_strict_formula_errors: bool = True
+    excel_max_json_chars: int = 8_000_000
+    excel_max_write_cells: int = 100_000
+    pdf_use_pymupdf: bool = False
+    """Use PyMuPDF for PDF inspect/extract_text; install it with the ``pdf-fast`` extra."""
 
     brave_api_key: str = ""
     timezone: str = "America/Los_Angeles"
@@ -6,6 +6,11 @@ from nexus.config import Settings
 from nexus.integrations.google_auth import load_google_credentials
 
 
+# Partial-response masks: only the parts of a document this client reads.
+DOCUMENT_TEXT_FIELDS = "documentId,title,body(content(paragraph(elements(textRun(content)))))"
+DOCUMENT_END_INDEX_FIELDS = "body(content(endIndex))"
+
+
 class DocsClient:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
@@ -87,7 +92,7 @@ class DocsClient:
                     ]
                 },
             ).execute()
-            document = service.documents().get(documentId=document_id).execute()
+            document = service.documents().get(documentId=document_id, fields=DOCUMENT_TEXT_FIELDS).execute()
 
         return {
             "document_id": str(document.get("documentId", "")),
@@ -97,7 +102,7 @@ class DocsClient:
 
     def append_text(self, document_id: str, text: str) -> dict[str, Any]:
         service = self._docs_service()
-        document = service.documents().get(documentId=document_id).execute()
+        document = service.documents().get(documentId=document_id, fields=DOCUMENT_END_INDEX_FIELDS).execute()
         append_index = self._content_end_index(document)
 
         service.documents().batchUpdate(
@@ -114,7 +119,7 @@ class DocsClient:
             },
         ).execute()
 
-        updated = service.documents().get(documentId=document_id).execute()
+        updated = service.documents().get(documentId=document_id, fields=DOCUMENT_TEXT_FIELDS).execute()
         return {
             "document_id": str(updated.get("documentId", document_id)),
             "title": str(updated.get("title", "")),
@@ -155,7 +160,7 @@ class DocsClient:
                     if isinstance(changed, int):
                         occurrences_changed = changed
 
-        updated = service.documents().get(documentId=document_id).execute()
+        updated = service.documents().get(documentId=document_id, fields=DOCUMENT_TEXT_FIELDS).execute()
         return {
             "document_id": str(updated.get("documentId", document_id)),
             "title": str(updated.get("title", "")),
@@ -165,7 +170,7 @@ class DocsClient:
 
     def cat_document(self, document_id: str) -> dict[str, Any]:
         service = self._docs_service()
-        document = service.documents().get(documentId=document_id).execute()
+        document = service.documents().get(documentId=document_id, fields=DOCUMENT_TEXT_FIELDS).execute()
         return {
             "document_id": str(document.get("documentId", "")),
             "title": str(document.get("title", "")),
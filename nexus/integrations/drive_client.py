@@ -7,6 +7,12 @@ from nexus.config import Settings
 from nexus.integrations.google_auth import load_google_credentials
 
 
+DEFAULT_SEARCH_FIELDS = (
+    "files(id,name,mimeType,modifiedTime,webViewLink,"
+    "owners(displayName,emailAddress))"
+)
+
+
 class DriveClient:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
@@ -21,17 +27,19 @@ class DriveClient:
         creds = load_google_credentials(self.settings)
         return build("drive", "v3", credentials=creds, cache_discovery=False)
 
-    def search(self, query: str, max_results: int) -> list[dict[str, Any]]:
+    def search(
+        self,
+        query: str,
+        max_results: int,
+        fields: str | None = None,
+    ) -> list[dict[str, Any]]:
         service = self._service()
         request = (
             service.files()
             .list(
                 q=query or None,
                 pageSize=max_results,
-                fields=(
-                    "files(id,name,mimeType,modifiedTime,webViewLink,"
-                    "owners(displayName,emailAddress))"
-                ),
+                fields=fields or DEFAULT_SEARCH_FIELDS,
                 supportsAllDrives=True,
                 includeItemsFromAllDrives=True,
             )
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
 
 
 EXCEL_ERROR_TOKENS = (
@@ -56,46 +57,49 @@ class ExcelRecalcEngine:
             "recalc_applied": recalc_applied,
         }
 
+    @staticmethod
+    def _iter_sheet_values(workbook):  # noqa: ANN001, ANN205
+        """Yield (sheet, row_number, row_values) from a read-only workbook."""
+        for sheet in workbook.worksheets:
+            # Ignore the stored <dimension>: a stale or placeholder one would cut the scan short.
+            sheet.reset_dimensions()
+            for row_number, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+                yield sheet, row_number, row
+
     def _count_formulas(self, workbook_path: Path) -> int:
-        keep_vba = workbook_path.suffix.lower() == ".xlsm"
-        workbook = load_workbook(workbook_path, data_only=False, keep_vba=keep_vba)
+        workbook = load_workbook(workbook_path, read_only=True, data_only=False, keep_links=False)
         try:
             count = 0
-            for sheet in workbook.worksheets:
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        value = cell.value
-                        if isinstance(value, str) and value.startswith("="):
-                            count += 1
+            for _sheet, _row_number, row in self._iter_sheet_values(workbook):
+                for value in row:
+                    if isinstance(value, str) and value.startswith("="):
+                        count += 1
             return count
         finally:
             workbook.close()
 
     def _scan_formula_errors(self, workbook_path: Path) -> tuple[int, dict[str, dict[str, Any]]]:
-        keep_vba = workbook_path.suffix.lower() == ".xlsm"
-        workbook = load_workbook(workbook_path, data_only=True, keep_vba=keep_vba)
+        workbook = load_workbook(workbook_path, read_only=True, data_only=True, keep_links=False)
         try:
             summary: dict[str, dict[str, Any]] = {}
             total = 0
             for token in EXCEL_ERROR_TOKENS:
                 summary[token] = {"count": 0, "locations": []}
 
-            for sheet in workbook.worksheets:
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        value = cell.value
-                        if not isinstance(value, str):
+            for sheet, row_number, row in self._iter_sheet_values(workbook):
+                for column, value in enumerate(row, start=1):
+                    if not isinstance(value, str):
+                        continue
+                    for token in EXCEL_ERROR_TOKENS:
+                        if token not in value:
                             continue
-                        for token in EXCEL_ERROR_TOKENS:
-                            if token not in value:
-                                continue
-                            total += 1
-                            data = summary[token]
-                            data["count"] = int(data["count"]) + 1
-                            locations = data["locations"]
-                            if isinstance(locations, list) and len(locations) < 50:
-                                locations.append(f"{sheet.title}!{cell.coordinate}")
-                            break
+                        total += 1
+                        data = summary[token]
+                        data["count"] = int(data["count"]) + 1
+                        locations = data["locations"]
+                        if isinstance(locations, list) and len(locations) < 50:
+                            locations.append(f"{sheet.title}!{get_column_letter(column)}{row_number}")
+                        break
 
             compact = {k: v for k, v in summary.items() if int(v.get("count", 0)) > 0}
             return total, compact
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-import base64
 import mimetypes
+import tempfile
+import threading
+from collections import OrderedDict
+from email.generator import BytesGenerator
 from email.message import EmailMessage
 from pathlib import Path
 from typing import Any
@@ -10,11 +13,44 @@ from nexus.config import Settings
 from nexus.integrations.google_auth import load_google_credentials
 
 
+# Gmail rejects batch requests with more than 100 calls.
+BATCH_MAX_REQUESTS = 100
+METADATA_HEADERS = ["From", "To", "Subject", "Date"]
+METADATA_CACHE_MAX_ENTRIES = 4096
+# Serialized MIME messages stay in memory up to this size before spilling to disk.
+UPLOAD_SPOOL_MAX_BYTES = 1024 * 1024
+# Gmail only accepts simple/multipart media uploads up to 5 MB.
+SIMPLE_UPLOAD_MAX_BYTES = 5 * 1024 * 1024
+
+
+class BatchFetchError(RuntimeError):
+    """Raised when a batched metadata fetch fails as a whole or for any item."""
+
+
 class GmailClient:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # Headers and snippet never change for a Gmail message id, so entries need no expiry.
+        self._metadata_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._metadata_lock = threading.Lock()
+        # httplib2 connections are not thread-safe, so each worker thread keeps its own service.
+        self._local = threading.local()
+
+    def _token_state(self) -> tuple[int, int] | None:
+        try:
+            token_stat = self.settings.google_token_path.stat()
+        except (AttributeError, OSError):
+            return None
+        return token_stat.st_mtime_ns, token_stat.st_size
 
     def _service(self):
+        token_state = self._token_state()
+        cached = getattr(self._local, "service", None)
+        if cached is not None:
+            cached_state, creds, service = cached
+            if cached_state == token_state and creds.valid:
+                return service
+
         try:
             from googleapiclient.discovery import build  # noqa: PLC0415
         except Exception as exc:  # noqa: BLE001
@@ -23,7 +59,10 @@ class GmailClient:
             ) from exc
 
         creds = load_google_credentials(self.settings)
-        return build("gmail", "v1", credentials=creds, cache_discovery=False)
+        service = build("gmail", "v1", credentials=creds, cache_discovery=False)
+        # Re-read the token state: loading may have refreshed and rewritten the token file.
+        self._local.service = (self._token_state(), creds, service)
+        return service
 
     @staticmethod
     def _header_value(headers: list[dict[str, str]], name: str) -> str:
@@ -46,6 +85,48 @@ class GmailClient:
             "snippet": str(full.get("snippet", "")),
         }
 
+    def _cached_metadata(self, message_id: str) -> dict[str, Any] | None:
+        with self._metadata_lock:
+            cached = self._metadata_cache.get(message_id)
+            if cached is None:
+                return None
+            self._metadata_cache.move_to_end(message_id)
+            return dict(cached)
+
+    def _remember_metadata(self, meta: dict[str, Any]) -> dict[str, Any]:
+        message_id = meta.get("id")
+        if message_id:
+            with self._metadata_lock:
+                self._metadata_cache[message_id] = dict(meta)
+                self._metadata_cache.move_to_end(message_id)
+                while len(self._metadata_cache) > METADATA_CACHE_MAX_ENTRIES:
+                    self._metadata_cache.popitem(last=False)
+        return meta
+
+    @staticmethod
+    def _execute_batch(service: Any, requests: list[Any]) -> list[dict[str, Any]]:
+        """Run GET requests through the batch endpoint, preserving request order."""
+        responses: dict[str, dict[str, Any]] = {}
+        errors: list[Exception] = []
+
+        def _collect(request_id: str, response: dict[str, Any], exception: Exception | None) -> None:
+            if exception is not None:
+                errors.append(exception)
+                return
+            responses[request_id] = response
+
+        for start in range(0, len(requests), BATCH_MAX_REQUESTS):
+            batch = service.new_batch_http_request(callback=_collect)
+            for offset, request in enumerate(requests[start : start + BATCH_MAX_REQUESTS]):
+                batch.add(request, request_id=str(start + offset))
+            try:
+                batch.execute()
+            except Exception as exc:  # noqa: BLE001
+                raise BatchFetchError(f"gmail batch request failed: {exc}") from exc
+        if errors:
+            raise BatchFetchError(f"gmail batch item failed: {errors[0]}") from errors[0]
+        return [responses[str(idx)] for idx in range(len(requests))]
+
     def search_threads(self, query: str, max_results: int) -> list[dict[str, Any]]:
         service = self._service()
         listing = (
@@ -54,22 +135,20 @@ class GmailClient:
             .list(userId="me", q=query, maxResults=max_results)
             .execute()
         )
-        out: list[dict[str, Any]] = []
-        for item in listing.get("threads", []) or []:
-            thread_id = item.get("id")
-            if not thread_id:
-                continue
-            full = (
-                service.users()
-                .threads()
-                .get(
-                    userId="me",
-                    id=thread_id,
-                    format="metadata",
-                    metadataHeaders=["From", "To", "Subject", "Date"],
-                )
-                .execute()
+        thread_ids = [item.get("id") for item in listing.get("threads", []) or [] if item.get("id")]
+        requests = [
+            service.users()
+            .threads()
+            .get(
+                userId="me",
+                id=thread_id,
+                format="metadata",
+                metadataHeaders=METADATA_HEADERS,
             )
+            for thread_id in thread_ids
+        ]
+        out: list[dict[str, Any]] = []
+        for thread_id, full in zip(thread_ids, self._execute_batch(service, requests)):
             messages = full.get("messages", []) or []
             latest = messages[-1] if messages else {}
             meta = (
@@ -90,32 +169,48 @@ class GmailClient:
             out.append(meta)
         return out
 
-    def list_messages(self, query: str, max_results: int) -> list[dict[str, Any]]:
-        service = self._service()
+    @staticmethod
+    def _metadata_request(service: Any, message_id: str) -> Any:
+        return (
+            service.users()
+            .messages()
+            .get(
+                userId="me",
+                id=message_id,
+                format="metadata",
+                metadataHeaders=METADATA_HEADERS,
+            )
+        )
+
+    @staticmethod
+    def _message_ids(service: Any, query: str, max_results: int) -> list[str]:
         listing = (
             service.users()
             .messages()
             .list(userId="me", q=query, maxResults=max_results)
             .execute()
         )
-        out: list[dict[str, Any]] = []
-        for item in listing.get("messages", []) or []:
-            msg_id = item.get("id")
-            if not msg_id:
-                continue
-            full = (
-                service.users()
-                .messages()
-                .get(
-                    userId="me",
-                    id=msg_id,
-                    format="metadata",
-                    metadataHeaders=["From", "To", "Subject", "Date"],
-                )
-                .execute()
-            )
-            out.append(self._message_metadata(full))
-        return out
+        return [str(item["id"]) for item in listing.get("messages", []) or [] if item.get("id")]
+
+    def list_message_ids(self, query: str, max_results: int) -> list[str]:
+        return self._message_ids(self._service(), query, max_results)
+
+    def get_message(self, message_id: str) -> dict[str, Any]:
+        cached = self._cached_metadata(message_id)
+        if cached is not None:
+            return cached
+        full = self._metadata_request(self._service(), message_id).execute()
+        return self._remember_metadata(self._message_metadata(full))
+
+    def list_messages(self, query: str, max_results: int) -> list[dict[str, Any]]:
+        service = self._service()
+        message_ids = self._message_ids(service, query, max_results)
+        found = {message_id: self._cached_metadata(message_id) for message_id in message_ids}
+        missing = [message_id for message_id, meta in found.items() if meta is None]
+        requests = [self._metadata_request(service, message_id) for message_id in missing]
+        for message_id, full in zip(missing, self._execute_batch(service, requests)):
+            found[message_id] = self._remember_metadata(self._message_metadata(full))
+        return [found[message_id] for message_id in message_ids]
 
     @staticmethod
     def _build_message(
@@ -172,6 +267,25 @@ class GmailClient:
             )
         return message
 
+    @staticmethod
+    def _message_upload(message: EmailMessage, spool: Any) -> Any:
+        # Uploading MIME bytes as media skips the base64url "raw" string, which held
+        # two extra full-size copies of every attachment.
+        try:
+            from googleapiclient.http import MediaIoBaseUpload  # noqa: PLC0415
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(
+                "Google API media upload dependency missing. Reinstall project dependencies."
+            ) from exc
+        BytesGenerator(spool, mangle_from_=False, policy=message.policy).flatten(message)
+        size = spool.tell()
+        spool.seek(0)
+        return MediaIoBaseUpload(
+            spool,
+            mimetype="message/rfc822",
+            resumable=size > SIMPLE_UPLOAD_MAX_BYTES,
+        )
+
     def send_message(
         self,
         *,
@@ -196,17 +310,16 @@ class GmailClient:
             reply_to_message_id=reply_to_message_id,
             attachments=attachments,
         )
-
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
-        payload: dict[str, Any] = {"raw": raw}
+        payload: dict[str, Any] = {}
         if thread_id:
             payload["threadId"] = thread_id
-        sent = (
-            service.users()
-            .messages()
-            .send(userId="me", body=payload)
-            .execute()
-        )
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_BYTES) as spool:
+            sent = (
+                service.users()
+                .messages()
+                .send(userId="me", body=payload, media_body=self._message_upload(message, spool))
+                .execute()
+            )
         return {
             "id": str(sent.get("id", "")),
             "thread_id": str(sent.get("threadId", "")),
@@ -237,11 +350,16 @@ class GmailClient:
             reply_to_message_id=reply_to_message_id,
             attachments=attachments,
         )
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
-        payload: dict[str, Any] = {"message": {"raw": raw}}
+        payload: dict[str, Any] = {"message": {}}
         if thread_id:
             payload["message"]["threadId"] = thread_id
-        draft = service.users().drafts().create(userId="me", body=payload).execute()
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_BYTES) as spool:
+            draft = (
+                service.users()
+                .drafts()
+                .create(userId="me", body=payload, media_body=self._message_upload(message, spool))
+                .execute()
+            )
         message_obj = draft.get("message", {}) if isinstance(draft, dict) else {}
         return {
             "id": str(draft.get("id", "")),
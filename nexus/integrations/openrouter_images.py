@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import base64
 import mimetypes
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -25,11 +27,14 @@ SIZE_TO_ASPECT_RATIO: dict[str, str] = {
 }
 
 ALLOWED_RESOLUTIONS = {"1K", "2K", "4K"}
+# Multiple of 4 so every slice of unwrapped base64 decodes on its own.
+BASE64_DECODE_CHUNK_CHARS = 4 * 256 * 1024
 
 
 class OpenRouterImageClient:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        self._workspace_root = settings.workspace.resolve()
 
     def _require_key(self) -> str:
         key = (self.settings.openrouter_api_key or "").strip()
@@ -157,11 +162,12 @@ class OpenRouterImageClient:
             return output_dir / f"image-{uuid4().hex[:12]}{suffix}"
 
         candidate = Path(output_path).expanduser()
-        if not candidate.is_absolute():
-            candidate = self.settings.workspace / candidate
-        resolved = candidate.resolve()
-        workspace = self.settings.workspace.resolve()
-        if workspace != resolved and workspace not in resolved.parents:
+        if candidate.is_absolute():
+            # Absolute paths come from ImagesTool already resolved; only normalise them lexically.
+            resolved = Path(os.path.normpath(candidate))
+        else:
+            resolved = (self._workspace_root / candidate).resolve()
+        if not resolved.is_relative_to(self._workspace_root):
             raise RuntimeError("output_path escapes workspace")
 
         if total <= 1:
@@ -178,15 +184,31 @@ class OpenRouterImageClient:
     def _save_data_url(self, data_url: str, output_path: str | None, index: int, total: int) -> dict[str, str]:
         if not data_url.startswith("data:") or ";base64," not in data_url:
             raise RuntimeError("image payload is not a base64 data URL")
-        header, encoded = data_url.split(",", 1)
+        comma = data_url.index(",")
+        header = data_url[:comma]
         mime_type = "image/png"
         if ";" in header:
             mime_type = header[5:].split(";", 1)[0] or mime_type
 
-        raw = base64.b64decode(encoded)
         target = self._resolve_output_target(output_path, mime_type, index=index, total=total)
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(raw)
+        if any(ch in data_url for ch in "\r\n "):
+            # Line-wrapped base64 cannot be sliced on fixed offsets; decode it in one go.
+            target.write_bytes(base64.b64decode(data_url[comma + 1 :]))
+        else:
+            # Decode straight to disk in slices instead of holding a second full copy of the
+            # payload as bytes (4K images run to tens of MB). Slices land in a staging file that
+            # replaces the target only once every slice has decoded, so a malformed payload never
+            # leaves partial data at (or over) the output path.
+            fd, staged = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    for start in range(comma + 1, len(data_url), BASE64_DECODE_CHUNK_CHARS):
+                        handle.write(base64.b64decode(data_url[start : start + BASE64_DECODE_CHUNK_CHARS]))
+                os.replace(staged, target)
+            except BaseException:
+                Path(staged).unlink(missing_ok=True)
+                raise
         return {
             "path": str(target),
             "file_name": target.name,
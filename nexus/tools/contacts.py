@@ -5,28 +5,40 @@ from typing import Any
 from nexus.config import Settings
 from nexus.integrations.contacts_client import ContactsClient
 from nexus.tools.base import BaseTool, ToolResult, ToolSpec
+from nexus.tools.google_errors import call_google_api
+
+
+def _format_contact_row(idx: int, row: dict[str, Any]) -> str:
+    emails = ", ".join(filter(None, row.get("emails", []))) or "-"
+    phones = ", ".join(filter(None, row.get("phones", []))) or "-"
+    return (
+        f"{idx}. {row.get('display_name') or '(no name)'}\n"
+        f"   emails={emails}\n"
+        f"   phones={phones}"
+    )
 
 
 class ContactsTool(BaseTool):
     name = "contacts"
+    _SPEC = ToolSpec(
+        name=name,
+        description="List Google Contacts entries.",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "action": {"type": "string", "enum": ["list"]},
+                "max_results": {"type": "integer"},
+            },
+            "required": ["action"],
+        },
+    )
 
     def __init__(self, settings: Settings, client: ContactsClient | None = None) -> None:
         self.settings = settings
         self.client = client or ContactsClient(settings)
 
     def spec(self) -> ToolSpec:
-        return ToolSpec(
-            name=self.name,
-            description="List Google Contacts entries.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "action": {"type": "string", "enum": ["list"]},
-                    "max_results": {"type": "integer"},
-                },
-                "required": ["action"],
-            },
-        )
+        return self._SPEC
 
     async def run(self, args: dict[str, Any]) -> ToolResult:
         action = args.get("action")
@@ -40,20 +52,13 @@ class ContactsTool(BaseTool):
         max_results = max(1, min(max_results, 200))
 
         try:
-            rows = self.client.list_contacts(max_results=max_results)
+            rows = await call_google_api(self.client.list_contacts, max_results=max_results)
         except Exception as exc:  # noqa: BLE001
             return ToolResult(ok=False, content=f"contacts list failed: {exc}")
 
         if not rows:
             return ToolResult(ok=True, content="No contacts found.")
-        lines = []
-        for idx, row in enumerate(rows, start=1):
-            display = row.get("display_name") or "(no name)"
-            emails = ", ".join([item for item in row.get("emails", []) if item]) or "-"
-            phones = ", ".join([item for item in row.get("phones", []) if item]) or "-"
-            lines.append(
-                f"{idx}. {display}\n"
-                f"   emails={emails}\n"
-                f"   phones={phones}"
-            )
-        return ToolResult(ok=True, content="\n".join(lines))
+        return ToolResult(
+            ok=True,
+            content="\n".join(_format_contact_row(idx, row) for idx, row in enumerate(rows, start=1)),
+        )
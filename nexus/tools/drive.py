@@ -1,136 +1,193 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from nexus.config import Settings
 from nexus.integrations.drive_client import DriveClient
 from nexus.tools.base import BaseTool, ToolResult, ToolSpec
+from nexus.tools.google_errors import WRITE_RETRY_STATUSES, call_google_api, normalize_google_error
+
+
+SEARCH_CACHE_TTL_SECONDS = 30.0
+SEARCH_CACHE_MAX_ENTRIES = 128
+# Only the fields rendered in search results.
+SEARCH_FIELDS = "files(id,name,mimeType,modifiedTime,webViewLink)"
+
+
+@dataclass(frozen=True, slots=True)
+class DriveArgs:
+    action: str
+    query: str
+    max_results: Any
+    path: str
+    name: str
+    mime_type: str
+    confirmed: bool
+
+    @classmethod
+    def from_dict(cls, args: dict[str, Any]) -> DriveArgs:
+        return cls(
+            action=str(args.get("action") or ""),
+            query=str(args.get("query") or "").strip(),
+            max_results=args.get("max_results"),
+            path=str(args.get("path") or "").strip(),
+            name=str(args.get("name") or "").strip(),
+            mime_type=str(args.get("mime_type") or "").strip(),
+            confirmed=bool(args.get("confirmed")),
+        )
 
 
-SCOPE_GUIDANCE = (
-    "Google connection is missing required scopes for this action. "
-    "Disconnect and reconnect Google from the dashboard."
-)
-
-
-def _normalize_google_error(prefix: str, exc: Exception) -> str:
-    message = str(exc)
-    lowered = message.lower()
-    if (
-        "insufficient authentication scopes" in lowered
-        or "insufficientpermissions" in lowered
-        or "insufficient permissions" in lowered
-        or "insufficient permission" in lowered
-    ):
-        return f"{prefix}: {SCOPE_GUIDANCE}"
-    return f"{prefix}: {message}"
+def _format_search_row(idx: int, row: dict[str, Any]) -> str:
+    return (
+        f"{idx}. {row.get('name') or '(untitled)'}\n"
+        f"   id={row.get('id') or '-'}\n"
+        f"   type={row.get('mime_type') or '-'}\n"
+        f"   modified={row.get('modified_time') or '-'}\n"
+        f"   link={row.get('web_view_link') or '-'}"
+    )
 
 
 class DriveTool(BaseTool):
     name = "drive"
+    _SPEC = ToolSpec(
+        name=name,
+        description="Search and upload Google Drive files.",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "action": {"type": "string", "enum": ["search", "upload"]},
+                "query": {"type": "string"},
+                "max_results": {"type": "integer"},
+                "path": {"type": "string"},
+                "name": {"type": "string"},
+                "mime_type": {"type": "string"},
+                "confirmed": {"type": "boolean"},
+            },
+            "required": ["action"],
+        },
+    )
 
     def __init__(self, settings: Settings, client: DriveClient | None = None) -> None:
         self.settings = settings
         self.client = client or DriveClient(settings)
+        self._workspace_root = settings.workspace.resolve()
+        self._search_cache: OrderedDict[tuple[str, int], tuple[float, list[dict[str, Any]]]] = OrderedDict()
 
     def spec(self) -> ToolSpec:
-        return ToolSpec(
-            name=self.name,
-            description="Search and upload Google Drive files.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "action": {"type": "string", "enum": ["search", "upload"]},
-                    "query": {"type": "string"},
-                    "max_results": {"type": "integer"},
-                    "path": {"type": "string"},
-                    "name": {"type": "string"},
-                    "mime_type": {"type": "string"},
-                    "confirmed": {"type": "boolean"},
-                },
-                "required": ["action"],
-            },
-        )
+        return self._SPEC
+
+    def _cached_search(self, key: tuple[str, int]) -> list[dict[str, Any]] | None:
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, rows = entry
+        if expires_at <= time.monotonic():
+            del self._search_cache[key]
+            return None
+        self._search_cache.move_to_end(key)
+        return rows
+
+    def _store_search(self, key: tuple[str, int], rows: list[dict[str, Any]]) -> None:
+        self._search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, rows)
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            self._search_cache.popitem(last=False)
 
     def _resolve_workspace_path(self, raw_path: str) -> Path:
         candidate = Path(raw_path).expanduser()
         if not candidate.is_absolute():
-            candidate = self.settings.workspace / candidate
+            candidate = self._workspace_root / candidate
         resolved = candidate.resolve()
-        workspace = self.settings.workspace.resolve()
-        if workspace != resolved and workspace not in resolved.parents:
+        if not resolved.is_relative_to(self._workspace_root):
             raise PermissionError("path escapes workspace")
         return resolved
 
-    async def run(self, args: dict[str, Any]) -> ToolResult:
-        action = str(args.get("action") or "")
-        if action not in {"search", "upload"}:
-            return ToolResult(ok=False, content=f"Unsupported action: {action}")
-
-        if action == "upload":
-            raw_path = str(args.get("path") or "").strip()
-            if not raw_path:
-                return ToolResult(ok=False, content="path is required for upload")
-            try:
-                source = self._resolve_workspace_path(raw_path)
-            except PermissionError as exc:
-                return ToolResult(ok=False, content=f"upload path rejected: {exc}")
-            if not source.exists() or not source.is_file():
-                return ToolResult(ok=False, content=f"file not found: {source}")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=(
-                        "Drive upload requires confirmation.\n"
-                        f"path={source}\n"
-                        f"name={str(args.get('name') or source.name)}\n"
-                        "Reply YES to proceed or NO to cancel."
-                    ),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-            try:
-                uploaded = self.client.upload_file(
-                    source,
-                    name=str(args.get("name") or "").strip() or source.name,
-                    mime_type=str(args.get("mime_type") or "").strip() or None,
-                )
-            except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=_normalize_google_error("drive upload failed", exc))
+    async def _upload(self, params: DriveArgs, args: dict[str, Any]) -> ToolResult:
+        if not params.path:
+            return ToolResult(ok=False, content="path is required for upload")
+        try:
+            source = self._resolve_workspace_path(params.path)
+        except PermissionError as exc:
+            return ToolResult(ok=False, content=f"upload path rejected: {exc}")
+        if not source.exists() or not source.is_file():
+            return ToolResult(ok=False, content=f"file not found: {source}")
+        if not params.confirmed:
             return ToolResult(
-                ok=True,
+                ok=False,
                 content=(
-                    "Drive upload complete.\n"
-                    f"id={uploaded.get('id')}\n"
-                    f"name={uploaded.get('name')}\n"
-                    f"type={uploaded.get('mime_type')}\n"
-                    f"link={uploaded.get('web_view_link') or uploaded.get('web_content_link') or '-'}"
+                    "Drive upload requires confirmation.\n"
+                    f"path={source}\n"
+                    f"name={params.name or source.name}\n"
+                    "Reply YES to proceed or NO to cancel."
                 ),
+                requires_confirmation=True,
+                risk_level="high",
+                proposed_action={"action": params.action, **args},
             )
+        try:
+            uploaded = await call_google_api(
+                self.client.upload_file,
+                source,
+                name=params.name or source.name,
+                mime_type=params.mime_type or None,
+                retry_statuses=WRITE_RETRY_STATUSES,
+            )
+        except Exception as exc:  # noqa: BLE001
+            return ToolResult(ok=False, content=normalize_google_error("drive upload failed", exc))
+        self._search_cache.clear()
+        return ToolResult(
+            ok=True,
+            content=(
+                "Drive upload complete.\n"
+                f"id={uploaded.get('id')}\n"
+                f"name={uploaded.get('name')}\n"
+                f"type={uploaded.get('mime_type')}\n"
+                f"link={uploaded.get('web_view_link') or uploaded.get('web_content_link') or '-'}"
+            ),
+        )
 
-        query = str(args.get("query") or "").strip()
+    async def _search(self, params: DriveArgs, args: dict[str, Any]) -> ToolResult:
+        query = params.query
         try:
-            max_results = int(args.get("max_results") or 10)
+            max_results = int(params.max_results or 10)
         except (TypeError, ValueError):
             return ToolResult(ok=False, content="max_results must be an integer")
         max_results = max(1, min(max_results, 50))
 
-        try:
-            rows = self.client.search(query=query, max_results=max_results)
-        except Exception as exc:  # noqa: BLE001
-            return ToolResult(ok=False, content=_normalize_google_error("drive search failed", exc))
+        cache_key = (query, max_results)
+        rows = self._cached_search(cache_key)
+        if rows is None:
+            try:
+                rows = await call_google_api(
+                    self.client.search,
+                    query=query,
+                    max_results=max_results,
+                    fields=SEARCH_FIELDS,
+                )
+            except Exception as exc:  # noqa: BLE001
+                return ToolResult(ok=False, content=normalize_google_error("drive search failed", exc))
+            self._store_search(cache_key, rows)
 
         if not rows:
             return ToolResult(ok=True, content="No matching Drive files found.")
-        lines = []
-        for idx, row in enumerate(rows, start=1):
-            lines.append(
-                f"{idx}. {row.get('name') or '(untitled)'}\n"
-                f"   id={row.get('id') or '-'}\n"
-                f"   type={row.get('mime_type') or '-'}\n"
-                f"   modified={row.get('modified_time') or '-'}\n"
-                f"   link={row.get('web_view_link') or '-'}"
-            )
-        return ToolResult(ok=True, content="\n".join(lines))
+        return ToolResult(
+            ok=True,
+            content="\n".join(_format_search_row(idx, row) for idx, row in enumerate(rows, start=1)),
+        )
+
+    _HANDLERS: dict[str, Callable[[DriveTool, DriveArgs, dict[str, Any]], Awaitable[ToolResult]]] = {
+        "search": _search,
+        "upload": _upload,
+    }
+
+    async def run(self, args: dict[str, Any]) -> ToolResult:
+        params = DriveArgs.from_dict(args)
+        handler = self._HANDLERS.get(params.action)
+        if handler is None:
+            return ToolResult(ok=False, content=f"Unsupported action: {params.action}")
+        return await handler(self, params, args)
@@ -1,137 +1,198 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import re
+import stat
+import sys
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from nexus.config import Settings
-from nexus.integrations.gmail_client import GmailClient
+from nexus.integrations.gmail_client import BatchFetchError, GmailClient
 from nexus.tools.base import BaseTool, ToolResult, ToolSpec
 
 
+# Upper bound on concurrent per-message GETs when the batch endpoint fails.
+FALLBACK_FETCH_CONCURRENCY = 10
+_ADDRESS_SEPARATOR_RE = re.compile(r"[,;]")
+_SNIPPET_NEWLINES = str.maketrans({"\n": " ", "\r": " "})
+
+
+def _arg_str(args: dict[str, Any], key: str, *, strip: bool = True) -> str:
+    value = args.get(key)
+    if not isinstance(value, str):
+        value = str(value) if value else ""
+    return value.strip() if strip else value
+
+
 def _to_email_list(value: Any) -> list[str]:
     if value is None:
         return []
     if isinstance(value, str):
-        parts = [chunk.strip() for chunk in value.replace(";", ",").split(",")]
-        return [part for part in parts if part]
+        return [part for part in map(str.strip, _ADDRESS_SEPARATOR_RE.split(value)) if part]
     if isinstance(value, list):
-        out: list[str] = []
-        for item in value:
-            if isinstance(item, str) and item.strip():
-                out.append(item.strip())
-        return out
+        return [part for part in (item.strip() for item in value if isinstance(item, str)) if part]
     return []
 
 
 def _to_attachment_candidates(value: Any) -> list[dict[str, str]]:
-    if value is None:
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, list):
         return []
     out: list[dict[str, str]] = []
-    if isinstance(value, str):
-        cleaned = value.strip()
-        if cleaned:
-            out.append({"path": cleaned})
-        return out
-    if isinstance(value, list):
-        for item in value:
-            if isinstance(item, str):
-                cleaned = item.strip()
-                if cleaned:
-                    out.append({"path": cleaned})
-                continue
-            if isinstance(item, dict):
-                raw_path = str(item.get("path") or "").strip()
-                if not raw_path:
-                    continue
-                normalized: dict[str, str] = {"path": raw_path}
-                file_name = str(item.get("file_name") or "").strip()
-                mime_type = str(item.get("mime_type") or "").strip()
-                if file_name:
-                    normalized["file_name"] = file_name
-                if mime_type:
-                    normalized["mime_type"] = mime_type
-                out.append(normalized)
+    for item in value:
+        if isinstance(item, str):
+            cleaned = item.strip()
+            if cleaned:
+                out.append({"path": cleaned})
+            continue
+        if not isinstance(item, dict):
+            continue
+        raw_path = item.get("path")
+        raw_path = raw_path.strip() if isinstance(raw_path, str) else ""
+        if not raw_path:
+            continue
+        normalized: dict[str, str] = {"path": raw_path}
+        for key in ("file_name", "mime_type"):
+            field = item.get(key)
+            field = field.strip() if isinstance(field, str) else ""
+            if field:
+                normalized[key] = field
+        out.append(normalized)
     return out
 
 
+def _clamp_max_results(value: int) -> int:
+    return max(1, min(value, 50))
+
+
+def _is_regular_file(path: Path) -> bool:
+    # One stat() answers both "exists" and "is a regular file".
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _format_summary_row(idx: int, msg: dict[str, Any]) -> str:
+    snippet = (msg.get("snippet") or "").translate(_SNIPPET_NEWLINES).strip()
+    if len(snippet) > 220:
+        snippet = snippet[:217] + "..."
+    message_count = msg.get("message_count")
+    count_line = f"   Messages: {message_count}\n" if message_count is not None else ""
+    return (
+        f"{idx}. {msg.get('subject') or '(no subject)'}\n"
+        f"   From: {msg.get('from') or '(unknown sender)'}\n"
+        f"   Date: {msg.get('date') or '(no date)'}\n"
+        f"   Thread: {msg.get('thread_id') or '-'}\n"
+        f"{count_line}"
+        f"   Summary: {snippet}"
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class EmailWriteArgs:
+    to: list[str]
+    cc: list[str]
+    bcc: list[str]
+    subject: str
+    body_text: str
+    body_html: str
+    reply_to_message_id: str
+    thread_id: str | None
+
+    @classmethod
+    def from_dict(cls, args: dict[str, Any]) -> EmailWriteArgs:
+        return cls(
+            to=_to_email_list(args.get("to")),
+            cc=_to_email_list(args.get("cc")),
+            bcc=_to_email_list(args.get("bcc")),
+            subject=_arg_str(args, "subject"),
+            body_text=_arg_str(args, "body_text", strip=False),
+            body_html=_arg_str(args, "body_html", strip=False),
+            reply_to_message_id=_arg_str(args, "reply_to_message_id"),
+            thread_id=_arg_str(args, "thread_id") or None,
+        )
+
+
 class EmailTool(BaseTool):
     name = "email"
+    _SPEC = ToolSpec(
+        name=name,
+        description=(
+            "Read Gmail threads/messages and perform draft/send/reply operations. "
+            "Write actions require explicit confirmation."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": [
+                        "summarize_unread",
+                        "summarize_search",
+                        "search_threads",
+                        "search_messages",
+                        "send_email",
+                        "create_draft",
+                        "send_draft",
+                        "reply",
+                    ],
+                },
+                "query": {"type": "string"},
+                "max_results": {"type": "integer"},
+                "to": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]},
+                "cc": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]},
+                "bcc": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]},
+                "subject": {"type": "string"},
+                "body_text": {"type": "string"},
+                "body_html": {"type": "string"},
+                "draft_id": {"type": "string"},
+                "reply_to_message_id": {"type": "string"},
+                "thread_id": {"type": "string"},
+                "attachments": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "array"},
+                    ]
+                },
+            },
+            "required": ["action"],
+        },
+    )
 
     def __init__(self, settings: Settings, client: GmailClient | None = None) -> None:
         self.settings = settings
         self.client = client or GmailClient(settings)
+        self._workspace_root = settings.workspace.resolve()
+        self._workspace_prefix = os.path.join(str(self._workspace_root), "")
+        self._default_max_results = _clamp_max_results(int(settings.email_summary_max_results or 10))
 
     def spec(self) -> ToolSpec:
-        return ToolSpec(
-            name=self.name,
-            description=(
-                "Read Gmail threads/messages and perform draft/send/reply operations. "
-                "Write actions require explicit confirmation."
-            ),
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": [
-                            "summarize_unread",
-                            "summarize_search",
-                            "search_threads",
-                            "search_messages",
-                            "send_email",
-                            "create_draft",
-                            "send_draft",
-                            "reply",
-                        ],
-                    },
-                    "query": {"type": "string"},
-                    "max_results": {"type": "integer"},
-                    "to": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]},
-                    "cc": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]},
-                    "bcc": {"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]},
-                    "subject": {"type": "string"},
-                    "body_text": {"type": "string"},
-                    "body_html": {"type": "string"},
-                    "draft_id": {"type": "string"},
-                    "reply_to_message_id": {"type": "string"},
-                    "thread_id": {"type": "string"},
-                    "attachments": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "array"},
-                        ]
-                    },
-                },
-                "required": ["action"],
-            },
-        )
+        return self._SPEC
+
+    async def _list_messages(self, query: str, max_results: int) -> list[dict[str, Any]]:
+        try:
+            return await asyncio.to_thread(self.client.list_messages, query, max_results=max_results)
+        except BatchFetchError:
+            message_ids = await asyncio.to_thread(self.client.list_message_ids, query, max_results=max_results)
+        semaphore = asyncio.Semaphore(FALLBACK_FETCH_CONCURRENCY)
+
+        async def _fetch(message_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self.client.get_message, message_id)
+
+        return list(await asyncio.gather(*(_fetch(message_id) for message_id in message_ids)))
 
     @staticmethod
     def _format_summary(messages: list[dict[str, Any]]) -> str:
         if not messages:
             return "No matching emails found."
-        lines = []
-        for i, msg in enumerate(messages, start=1):
-            sender = msg.get("from") or "(unknown sender)"
-            subject = msg.get("subject") or "(no subject)"
-            date = msg.get("date") or "(no date)"
-            snippet = (msg.get("snippet") or "").strip()
-            snippet = snippet.replace("\n", " ").strip()
-            if len(snippet) > 220:
-                snippet = snippet[:217] + "..."
-            thread_id = msg.get("thread_id") or "-"
-            message_count = msg.get("message_count")
-            line = (
-                f"{i}. {subject}\n"
-                f"   From: {sender}\n"
-                f"   Date: {date}\n"
-                f"   Thread: {thread_id}"
-            )
-            if message_count is not None:
-                line += f"\n   Messages: {message_count}"
-            line += f"\n   Summary: {snippet}"
-            lines.append(line)
-        return "\n".join(lines)
+        return "\n".join(_format_summary_row(idx, msg) for idx, msg in enumerate(messages, start=1))
 
     @staticmethod
     def _write_preview(
@@ -147,25 +208,28 @@ class EmailTool(BaseTool):
         reply_to_message_id: str = "",
         attachments: list[dict[str, str]] | None = None,
     ) -> str:
-        preview_lines = [
+        body_text = body_text.strip()
+        body_html = body_html.strip()
+        parts = [
             f"Email action requires confirmation: {action}",
-            f"To: {', '.join(to) if to else '(none)'}",
-            f"Cc: {', '.join(cc) if cc else '(none)'}",
-            f"Bcc: {', '.join(bcc) if bcc else '(none)'}",
+            f"To: {', '.join(to) or '(none)'}",
+            f"Cc: {', '.join(cc) or '(none)'}",
+            f"Bcc: {', '.join(bcc) or '(none)'}",
             f"Subject: {subject or '(no subject)'}",
         ]
         if draft_id:
-            preview_lines.append(f"Draft ID: {draft_id}")
+            parts.append(f"Draft ID: {draft_id}")
         if reply_to_message_id:
-            preview_lines.append(f"Reply-To-Message-ID: {reply_to_message_id}")
-        if body_text.strip():
-            preview_lines.append(f"Body (text): {body_text.strip()[:500]}")
-        elif body_html.strip():
-            preview_lines.append(f"Body (html): {body_html.strip()[:500]}")
+            parts.append(f"Reply-To-Message-ID: {reply_to_message_id}")
+        if body_text:
+            parts.append(f"Body (text): {body_text[:500]}")
+        elif body_html:
+            parts.append(f"Body (html): {body_html[:500]}")
         if attachments:
-            preview_lines.append(f"Attachments: {', '.join(item.get('file_name') or item.get('path', '-') for item in attachments)}")
-        preview_lines.append("Reply YES to proceed or NO to cancel.")
-        return "\n".join(preview_lines)
+            names = ", ".join(item.get("file_name") or item.get("path", "-") for item in attachments)
+            parts.append(f"Attachments: {names}")
+        parts.append("Reply YES to proceed or NO to cancel.")
+        return "\n".join(parts)
 
     @staticmethod
     def _looks_like_basename(path_value: str) -> bool:
@@ -179,7 +243,7 @@ class EmailTool(BaseTool):
         attachments = _to_attachment_candidates(raw_value)
         if not attachments:
             return [], None
-        workspace = self.settings.workspace.resolve()
+        workspace = self._workspace_root
         resolved: list[dict[str, str]] = []
         for item in attachments:
             raw_path = str(item.get("path") or "").strip()
@@ -188,18 +252,26 @@ class EmailTool(BaseTool):
             candidate = Path(raw_path).expanduser()
             if not candidate.is_absolute():
                 candidate = workspace / candidate
-            full = candidate.resolve()
-            if (not full.exists() or not full.is_file()) and self._looks_like_basename(raw_path):
+            try:
+                os.lstat(candidate)
+            except OSError:
+                # Nothing exists there, so skip the readlink walk and normalise lexically.
+                full = Path(os.path.abspath(candidate))
+            else:
+                full = candidate.resolve()
+            is_file = _is_regular_file(full)
+            if not is_file and self._looks_like_basename(raw_path):
                 matches = sorted(path.resolve() for path in workspace.rglob(raw_path) if path.is_file())
                 if len(matches) == 1:
                     full = matches[0]
+                    is_file = True
                 elif len(matches) > 1:
                     options = [str(path.relative_to(workspace)) for path in matches[:6]]
                     suffix = " ..." if len(matches) > 6 else ""
                     return [], f"attachment filename is ambiguous; use one of: {', '.join(options)}{suffix}"
-            if workspace != full and workspace not in full.parents:
+            if not str(full).startswith(self._workspace_prefix) and full != workspace:
                 return [], f"attachment path escapes workspace: {full}"
-            if not full.exists() or not full.is_file():
+            if not is_file:
                 return (
                     [],
                     (
@@ -217,154 +289,164 @@ class EmailTool(BaseTool):
             resolved.append(payload)
         return resolved, None
 
-    async def run(self, args: dict[str, Any]) -> ToolResult:
-        action = str(args.get("action") or "")
+    def _max_results(self, args: dict[str, Any]) -> int | None:
+        raw = args.get("max_results")
+        if not raw:
+            return self._default_max_results
         try:
-            max_results = int(args.get("max_results") or self.settings.email_summary_max_results or 10)
+            return _clamp_max_results(int(raw))
         except (TypeError, ValueError):
+            return None
+
+    async def _summarize_unread(self, action: str, args: dict[str, Any]) -> ToolResult:
+        max_results = self._max_results(args)
+        if max_results is None:
+            return ToolResult(ok=False, content="max_results must be an integer")
+        try:
+            messages = await self._list_messages("is:unread", max_results=max_results)
+        except Exception as exc:  # noqa: BLE001
+            return ToolResult(ok=False, content=f"email unread summary failed: {exc}")
+        return ToolResult(ok=True, content=self._format_summary(messages))
+
+    async def _search_messages(self, action: str, args: dict[str, Any]) -> ToolResult:
+        max_results = self._max_results(args)
+        if max_results is None:
             return ToolResult(ok=False, content="max_results must be an integer")
-        max_results = max(1, min(max_results, 50))
+        query = _arg_str(args, "query")
+        if not query:
+            return ToolResult(ok=False, content=f"query is required for {action}")
+        try:
+            messages = await self._list_messages(query, max_results=max_results)
+        except Exception as exc:  # noqa: BLE001
+            return ToolResult(ok=False, content=f"email message search failed: {exc}")
+        return ToolResult(ok=True, content=self._format_summary(messages))
 
-        if action == "summarize_unread":
-            try:
-                messages = self.client.list_messages("is:unread", max_results=max_results)
-            except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=f"email unread summary failed: {exc}")
-            return ToolResult(ok=True, content=self._format_summary(messages))
-
-        if action in {"summarize_search", "search_messages"}:
-            query = str(args.get("query") or "").strip()
-            if not query:
-                return ToolResult(ok=False, content=f"query is required for {action}")
-            try:
-                messages = self.client.list_messages(query, max_results=max_results)
-            except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=f"email message search failed: {exc}")
-            return ToolResult(ok=True, content=self._format_summary(messages))
-
-        if action == "search_threads":
-            query = str(args.get("query") or "").strip()
-            if not query:
-                return ToolResult(ok=False, content="query is required for search_threads")
-            try:
-                threads = self.client.search_threads(query, max_results=max_results)
-            except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=f"email thread search failed: {exc}")
-            return ToolResult(ok=True, content=self._format_summary(threads))
-
-        to = _to_email_list(args.get("to"))
-        cc = _to_email_list(args.get("cc"))
-        bcc = _to_email_list(args.get("bcc"))
-        subject = str(args.get("subject") or "").strip()
-        body_text = str(args.get("body_text") or "")
-        body_html = str(args.get("body_html") or "")
-        draft_id = str(args.get("draft_id") or "").strip()
-        reply_to_message_id = str(args.get("reply_to_message_id") or "").strip()
-        thread_id = str(args.get("thread_id") or "").strip() or None
+    async def _search_threads(self, action: str, args: dict[str, Any]) -> ToolResult:
+        max_results = self._max_results(args)
+        if max_results is None:
+            return ToolResult(ok=False, content="max_results must be an integer")
+        query = _arg_str(args, "query")
+        if not query:
+            return ToolResult(ok=False, content="query is required for search_threads")
+        try:
+            threads = await asyncio.to_thread(self.client.search_threads, query, max_results=max_results)
+        except Exception as exc:  # noqa: BLE001
+            return ToolResult(ok=False, content=f"email thread search failed: {exc}")
+        return ToolResult(ok=True, content=self._format_summary(threads))
+
+    async def _send_draft(self, action: str, args: dict[str, Any]) -> ToolResult:
+        draft_id = _arg_str(args, "draft_id")
         attachments, attachment_error = self._normalize_attachments(args.get("attachments"))
         if attachment_error:
             return ToolResult(ok=False, content=attachment_error)
-
-        if action == "send_draft":
-            if not draft_id:
-                return ToolResult(ok=False, content="draft_id is required for send_draft")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(
-                        action=action,
-                        to=[],
-                        cc=[],
-                        bcc=[],
-                        subject="",
-                        body_text="",
-                        body_html="",
-                        draft_id=draft_id,
-                        attachments=attachments,
-                    ),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-            try:
-                result = self.client.send_draft(draft_id=draft_id)
-            except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=f"send_draft failed: {exc}")
+        if not draft_id:
+            return ToolResult(ok=False, content="draft_id is required for send_draft")
+        if not args.get("confirmed"):
             return ToolResult(
-                ok=True,
-                content=f"Draft sent.\nid={result.get('id')}\nthread_id={result.get('thread_id')}",
+                ok=False,
+                content=self._write_preview(
+                    action=action,
+                    to=[],
+                    cc=[],
+                    bcc=[],
+                    subject="",
+                    body_text="",
+                    body_html="",
+                    draft_id=draft_id,
+                    attachments=attachments,
+                ),
+                requires_confirmation=True,
+                risk_level="high",
+                proposed_action={"action": action, **args},
             )
+        try:
+            result = self.client.send_draft(draft_id=draft_id)
+        except Exception as exc:  # noqa: BLE001
+            return ToolResult(ok=False, content=f"send_draft failed: {exc}")
+        return ToolResult(
+            ok=True,
+            content=f"Draft sent.\nid={result.get('id')}\nthread_id={result.get('thread_id')}",
+        )
 
-        if action in {"send_email", "create_draft", "reply"}:
-            if not to:
-                return ToolResult(ok=False, content=f"to recipient(s) are required for {action}")
-            if action == "reply" and not reply_to_message_id:
-                return ToolResult(ok=False, content="reply_to_message_id is required for reply")
-
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(
-                        action=action,
-                        to=to,
-                        cc=cc,
-                        bcc=bcc,
-                        subject=subject,
-                        body_text=body_text,
-                        body_html=body_html,
-                        reply_to_message_id=reply_to_message_id,
-                        attachments=attachments,
-                    ),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
+    async def _compose(self, action: str, args: dict[str, Any]) -> ToolResult:
+        message = EmailWriteArgs.from_dict(args)
+        attachments, attachment_error = self._normalize_attachments(args.get("attachments"))
+        if attachment_error:
+            return ToolResult(ok=False, content=attachment_error)
+        if not message.to:
+            return ToolResult(ok=False, content=f"to recipient(s) are required for {action}")
+        if action == "reply" and not message.reply_to_message_id:
+            return ToolResult(ok=False, content="reply_to_message_id is required for reply")
 
-            try:
-                if action == "create_draft":
-                    result = self.client.create_draft(
-                        to=to,
-                        cc=cc,
-                        bcc=bcc,
-                        subject=subject,
-                        body_text=body_text,
-                        body_html=body_html,
-                        reply_to_message_id=reply_to_message_id or None,
-                        thread_id=thread_id,
-                        attachments=attachments,
-                    )
-                    return ToolResult(
-                        ok=True,
-                        content=(
-                            "Draft created.\n"
-                            f"id={result.get('id')}\n"
-                            f"message_id={result.get('message_id')}\n"
-                            f"thread_id={result.get('thread_id')}"
-                        ),
-                    )
-
-                result = self.client.send_message(
-                    to=to,
-                    cc=cc,
-                    bcc=bcc,
-                    subject=subject,
-                    body_text=body_text,
-                    body_html=body_html,
-                    reply_to_message_id=reply_to_message_id or None,
-                    thread_id=thread_id,
+        if not args.get("confirmed"):
+            return ToolResult(
+                ok=False,
+                content=self._write_preview(
+                    action=action,
+                    to=message.to,
+                    cc=message.cc,
+                    bcc=message.bcc,
+                    subject=message.subject,
+                    body_text=message.body_text,
+                    body_html=message.body_html,
+                    reply_to_message_id=message.reply_to_message_id,
                     attachments=attachments,
-                )
-            except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=f"{action} failed: {exc}")
+                ),
+                requires_confirmation=True,
+                risk_level="high",
+                proposed_action={"action": action, **args},
+            )
+
+        send = self.client.create_draft if action == "create_draft" else self.client.send_message
+        try:
+            result = send(
+                to=message.to,
+                cc=message.cc,
+                bcc=message.bcc,
+                subject=message.subject,
+                body_text=message.body_text,
+                body_html=message.body_html,
+                reply_to_message_id=message.reply_to_message_id or None,
+                thread_id=message.thread_id,
+                attachments=attachments,
+            )
+        except Exception as exc:  # noqa: BLE001
+            return ToolResult(ok=False, content=f"{action} failed: {exc}")
 
-            success_label = "Reply sent successfully." if action == "reply" else "Email sent successfully."
+        if action == "create_draft":
             return ToolResult(
                 ok=True,
                 content=(
-                    f"{success_label}\n"
+                    "Draft created.\n"
                     f"id={result.get('id')}\n"
+                    f"message_id={result.get('message_id')}\n"
                     f"thread_id={result.get('thread_id')}"
                 ),
             )
+        success_label = "Reply sent successfully." if action == "reply" else "Email sent successfully."
+        return ToolResult(
+            ok=True,
+            content=(
+                f"{success_label}\n"
+                f"id={result.get('id')}\n"
+                f"thread_id={result.get('thread_id')}"
+            ),
+        )
 
-        return ToolResult(ok=False, content=f"Unsupported action: {action}")
+    _HANDLERS: dict[str, Callable[[EmailTool, str, dict[str, Any]], Awaitable[ToolResult]]] = {
+        "summarize_unread": _summarize_unread,
+        "summarize_search": _search_messages,
+        "search_messages": _search_messages,
+        "search_threads": _search_threads,
+        "send_draft": _send_draft,
+        "send_email": _compose,
+        "create_draft": _compose,
+        "reply": _compose,
+    }
+
+    async def run(self, args: dict[str, Any]) -> ToolResult:
+        action = sys.intern(_arg_str(args, "action", strip=False))
+        handler = self._HANDLERS.get(action)
+        if handler is None:
+            return ToolResult(ok=False, content=f"Unsupported action: {action}")
+        return await handler(self, action, args)
@@ -1,26 +1,87 @@
 from __future__ import annotations
 
+import asyncio
+import csv
+import functools
+import importlib.util
 import json
 import re
+import threading
+import zipfile
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from copy import copy
 from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree
 
-import pandas as pd
 from openpyxl import Workbook, load_workbook
 from openpyxl.chart import BarChart, LineChart, Reference
 from openpyxl.comments import Comment
 from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, range_boundaries
+from openpyxl.utils.exceptions import CellCoordinatesException
 
 from nexus.config import Settings
 from nexus.integrations.excel_recalc import ExcelRecalcEngine
 from nexus.tools.base import BaseTool, ToolResult, ToolSpec
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 XLSM_MIME = "application/vnd.ms-excel.sheet.macroEnabled.12"
 CSV_MIME = "text/csv"
 TSV_MIME = "text/tab-separated-values"
+READ_WINDOW_ROWS = 60
+READ_WINDOW_COLS = 18
+READ_ONLY_CACHE_MAX_ENTRIES = 8
+RECALC_CACHE_MAX_ENTRIES = 32
+CSV_WRITE_BUFFER_BYTES = 1 << 20
+ALL_SHEETS = "*"
+CONVERT_SHEET_CONCURRENCY = 8
+_DEFAULT_STYLE_IDS = StyleArray()
+_HEADER_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+SPREADSHEETML_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_WRITE_PREVIEW_TEMPLATE = (
+    "Excel write operation requires confirmation.\naction={action}\n{details}Reply YES to proceed or NO to cancel."
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# xlsxwriter streams straight into the zip instead of building an openpyxl cell model; pandas
+# falls back to openpyxl when it is not installed. Only used for fresh .xlsx outputs.
+XLSX_FAST_ENGINE = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") is not None else None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def _json_loads(value: str) -> Any:
+        return orjson.loads(value)
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, default=_json_default).decode("utf-8")
+
+else:
+
+    def _json_loads(value: str) -> Any:
+        return json.loads(value)
+
+    def _json_dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_json_default)
 
 
 def _to_rows(value: Any) -> list[list[Any]] | None:
@@ -32,31 +93,101 @@ def _to_rows(value: Any) -> list[list[Any]] | None:
         return [value]
     if isinstance(value, str):
         try:
-            parsed = json.loads(value)
+            parsed = _json_loads(value)
         except json.JSONDecodeError:
             return None
         return _to_rows(parsed)
     return None
 
 
-def _json_safe_cell(value: Any) -> Any:
-    if isinstance(value, (datetime, date, time)):
-        return value.isoformat()
-    if isinstance(value, timedelta):
-        return str(value)
-    return value
+def _excel_engine(output_path: Path) -> str | None:
+    return XLSX_FAST_ENGINE if output_path.suffix.lower() == ".xlsx" else None
+
+
+def _is_formula(value: Any) -> bool:
+    # Only strip when there is leading whitespace; plain strings and numbers never allocate.
+    if not isinstance(value, str):
+        return False
+    return value.startswith("=") or (value[:1].isspace() and value.lstrip().startswith("="))
+
 
+def _cell_position(cell_ref: Any) -> tuple[int, int]:
+    column, row = coordinate_from_string(str(cell_ref).strip().upper())
+    return row, column_index_from_string(column)
 
-def _json_safe_rows(rows: list[list[Any]]) -> list[list[Any]]:
-    return [[_json_safe_cell(cell) for cell in row] for row in rows]
+
+def _trim_empty_edges(rows: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    while rows and all(value is None for value in rows[-1]):
+        rows.pop()
+    width = 0
+    for row in rows:
+        for idx in range(len(row), width, -1):
+            if row[idx - 1] is not None:
+                width = idx
+                break
+    return [row[:width] for row in rows]
+
+
+def _sheet_names_from_archive(file_path: Path) -> list[str] | None:
+    """Read sheet names straight from xl/workbook.xml, skipping shared strings and styles."""
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            root = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    except (KeyError, OSError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+    sheets = root.find(f"{SPREADSHEETML_NS}sheets")
+    if sheets is None:
+        return None
+    names = [sheet.get("name") for sheet in sheets.iterfind(f"{SPREADSHEETML_NS}sheet")]
+    if not names or not all(names):
+        return None
+    return names
+
+
+def _read_window(ws) -> list[tuple[Any, ...]]:  # noqa: ANN001
+    max_row, max_col = ws.max_row, ws.max_column
+    if max_row and max_col and (max_row, max_col) != (1, 1):
+        return list(
+            ws.iter_rows(
+                min_row=1,
+                max_row=min(max_row, READ_WINDOW_ROWS),
+                max_col=min(max_col, READ_WINDOW_COLS),
+                values_only=True,
+            )
+        )
+    # Unsized or placeholder "A1" dimensions: stream the fixed window and drop the empty tail
+    # instead of letting openpyxl scan the whole sheet to size it.
+    ws.reset_dimensions()
+    rows = list(ws.iter_rows(min_row=1, max_row=READ_WINDOW_ROWS, max_col=READ_WINDOW_COLS, values_only=True))
+    return _trim_empty_edges(rows)
+
+
+def _read_range(ws, range_a1: str) -> list[tuple[Any, ...]]:  # noqa: ANN001
+    min_col, min_row, max_col, max_row = range_boundaries(range_a1)
+    return list(ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True))
+
+
+def _write_delimited(ws, output_path: Path, sep: str) -> None:  # noqa: ANN001
+    """Stream a read-only worksheet into a CSV/TSV file one row at a time."""
+    max_row, max_col = ws.max_row, ws.max_column
+    if not max_row or not max_col or (max_row, max_col) == (1, 1):
+        ws.reset_dimensions()
+    with output_path.open("w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_BYTES) as handle:
+        csv.writer(handle, delimiter=sep, lineterminator="\n").writerows(ws.iter_rows(values_only=True))
+
+
+def _write_frame_delimited(df: pd.DataFrame, output_path: Path, sep: str) -> None:
+    # A large write buffer turns pandas' per-chunk writes into far fewer syscalls.
+    with output_path.open("w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_BYTES) as handle:
+        df.to_csv(handle, index=False, sep=sep)
 
 
 def _normalize_header(value: Any) -> str:
     raw = str(value or "").strip().lower()
     if not raw:
         return "column"
-    raw = re.sub(r"[^a-z0-9]+", "_", raw)
-    raw = re.sub(r"_+", "_", raw).strip("_")
+    # "_" is itself outside [a-z0-9], so one pass already collapses underscore runs.
+    raw = _HEADER_SEPARATOR_RE.sub("_", raw).strip("_")
     return raw or "column"
 
 
@@ -77,81 +208,99 @@ def _qualify_range(sheet_name: str, range_string: str) -> str:
     return range_string if "!" in range_string else f"{sheet_name}!{range_string}"
 
 
+_Handler = Callable[["ExcelTool", Path, dict[str, Any]], Awaitable[ToolResult]]
+
+
+def _requires_existing_workbook(handler: _Handler) -> _Handler:
+    @functools.wraps(handler)
+    async def wrapper(self: ExcelTool, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        if not file_path.exists():
+            return ToolResult(ok=False, content=f"workbook not found: {file_path}")
+        return await handler(self, file_path, args)
+
+    return wrapper
+
+
 class ExcelTool(BaseTool):
     name = "excel"
+    _SPEC = ToolSpec(
+        name=name,
+        description="Professional Excel workflows for local spreadsheets in workspace.",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "action": {
+                    "type": "string",
+                    "enum": [
+                        "create",
+                        "list_sheets",
+                        "read",
+                        "write_cells",
+                        "append_rows",
+                        "add_sheet",
+                        "convert",
+                        "clean_table",
+                        "set_number_format",
+                        "set_style",
+                        "add_comment",
+                        "create_chart",
+                        "recalc_validate",
+                    ],
+                },
+                "path": {"type": "string"},
+                "output_path": {"type": "string"},
+                "sheet": {"type": "string"},
+                "sheet_name": {"type": "string"},
+                "range": {"type": "string"},
+                "cells": {"oneOf": [{"type": "object"}, {"type": "string"}]},
+                "rows": {"oneOf": [{"type": "array"}, {"type": "string"}]},
+                "normalize_headers": {"type": "boolean"},
+                "drop_empty_rows": {"type": "boolean"},
+                "drop_empty_cols": {"type": "boolean"},
+                "normalize_types": {"type": "boolean"},
+                "number_format": {"type": "string"},
+                "format": {"type": "string"},
+                "preset": {"type": "string", "enum": ["professional"]},
+                "font_name": {"type": "string"},
+                "font_size": {"type": "number"},
+                "bold": {"type": "boolean"},
+                "italic": {"type": "boolean"},
+                "font_color": {"type": "string"},
+                "fill_color": {"type": "string"},
+                "horizontal": {"type": "string"},
+                "vertical": {"type": "string"},
+                "cell": {"type": "string"},
+                "comment": {"type": "string"},
+                "author": {"type": "string"},
+                "chart_type": {"type": "string", "enum": ["line", "bar", "column"]},
+                "data_range": {"type": "string"},
+                "category_range": {"type": "string"},
+                "title": {"type": "string"},
+                "position": {"type": "string"},
+                "confirmed": {"type": "boolean"},
+            },
+            "required": ["action"],
+        },
+    )
 
     def __init__(self, settings: Settings, recalc_engine: ExcelRecalcEngine | None = None) -> None:
         self.settings = settings
         self.recalc_engine = recalc_engine or ExcelRecalcEngine(timeout_seconds=settings.excel_recalc_timeout_seconds)
+        self._workspace_root = settings.workspace.resolve()
+        self._read_only_cache: OrderedDict[Path, tuple[tuple[int, int], Any]] = OrderedDict()
+        self._read_only_cache_lock = threading.Lock()
+        self._recalc_cache: OrderedDict[tuple[Path, int, int], dict[str, Any]] = OrderedDict()
+        self._recalc_cache_lock = threading.Lock()
 
     def spec(self) -> ToolSpec:
-        return ToolSpec(
-            name=self.name,
-            description="Professional Excel workflows for local spreadsheets in workspace.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": [
-                            "create",
-                            "list_sheets",
-                            "read",
-                            "write_cells",
-                            "append_rows",
-                            "add_sheet",
-                            "convert",
-                            "clean_table",
-                            "set_number_format",
-                            "set_style",
-                            "add_comment",
-                            "create_chart",
-                            "recalc_validate",
-                        ],
-                    },
-                    "path": {"type": "string"},
-                    "output_path": {"type": "string"},
-                    "sheet": {"type": "string"},
-                    "sheet_name": {"type": "string"},
-                    "range": {"type": "string"},
-                    "cells": {"oneOf": [{"type": "object"}, {"type": "string"}]},
-                    "rows": {"oneOf": [{"type": "array"}, {"type": "string"}]},
-                    "normalize_headers": {"type": "boolean"},
-                    "drop_empty_rows": {"type": "boolean"},
-                    "drop_empty_cols": {"type": "boolean"},
-                    "normalize_types": {"type": "boolean"},
-                    "number_format": {"type": "string"},
-                    "format": {"type": "string"},
-                    "preset": {"type": "string", "enum": ["professional"]},
-                    "font_name": {"type": "string"},
-                    "font_size": {"type": "number"},
-                    "bold": {"type": "boolean"},
-                    "italic": {"type": "boolean"},
-                    "font_color": {"type": "string"},
-                    "fill_color": {"type": "string"},
-                    "horizontal": {"type": "string"},
-                    "vertical": {"type": "string"},
-                    "cell": {"type": "string"},
-                    "comment": {"type": "string"},
-                    "author": {"type": "string"},
-                    "chart_type": {"type": "string", "enum": ["line", "bar", "column"]},
-                    "data_range": {"type": "string"},
-                    "category_range": {"type": "string"},
-                    "title": {"type": "string"},
-                    "position": {"type": "string"},
-                    "confirmed": {"type": "boolean"},
-                },
-                "required": ["action"],
-            },
-        )
+        return self._SPEC
 
     def _resolve_workspace_path(self, raw_path: str) -> Path:
         candidate = Path(raw_path).expanduser()
         if not candidate.is_absolute():
-            candidate = self.settings.workspace / candidate
+            candidate = self._workspace_root / candidate
         resolved = candidate.resolve()
-        workspace = self.settings.workspace.resolve()
-        if workspace != resolved and workspace not in resolved.parents:
+        if not resolved.is_relative_to(self._workspace_root):
             raise PermissionError("path escapes workspace")
         return resolved
 
@@ -174,13 +323,29 @@ class ExcelTool(BaseTool):
 
     @staticmethod
     def _write_preview(action: str, details: list[str]) -> str:
-        lines = [
-            "Excel write operation requires confirmation.",
-            f"action={action}",
-            *details,
-            "Reply YES to proceed or NO to cancel.",
-        ]
-        return "\n".join(lines)
+        return _WRITE_PREVIEW_TEMPLATE.format(action=action, details="".join(f"{line}\n" for line in details))
+
+    def _confirmation(self, action: str, args: dict[str, Any], details: list[str]) -> ToolResult:
+        return ToolResult(
+            ok=False,
+            content=self._write_preview(action, details),
+            requires_confirmation=True,
+            risk_level="high",
+            proposed_action={"action": action, **args},
+        )
+
+    def _payload_error(self, name: str, value: Any) -> ToolResult | None:
+        """Reject oversized JSON strings before parsing them only to throw the result away."""
+        limit = self.settings.excel_max_json_chars
+        if isinstance(value, str) and len(value) > limit:
+            return ToolResult(ok=False, content=f"{name} payload too large: {len(value)} chars (max {limit})")
+        return None
+
+    def _cell_count_error(self, count: int) -> ToolResult | None:
+        limit = self.settings.excel_max_write_cells
+        if count > limit:
+            return ToolResult(ok=False, content=f"too many cells in one write: {count} (max {limit})")
+        return None
 
     @staticmethod
     def _load_cells(value: Any) -> dict[str, Any] | None:
@@ -188,7 +353,7 @@ class ExcelTool(BaseTool):
             return value
         if isinstance(value, str):
             try:
-                parsed = json.loads(value)
+                parsed = _json_loads(value)
             except json.JSONDecodeError:
                 return None
             if isinstance(parsed, dict):
@@ -197,29 +362,74 @@ class ExcelTool(BaseTool):
 
     @staticmethod
     def _iter_cells_from_range(worksheet, range_a1: str):  # noqa: ANN001
-        cells = worksheet[range_a1]
-        if isinstance(cells, tuple):
-            if cells and isinstance(cells[0], tuple):
-                for row in cells:
-                    for cell in row:
-                        yield cell
-            else:
-                for cell in cells:
-                    yield cell
-            return
-        yield cells
+        # Walk the range lazily; worksheet[range_a1] would build the whole tuple grid first.
+        min_col, min_row, max_col, max_row = range_boundaries(range_a1)
+        for row in worksheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
+            yield from row
 
     @staticmethod
     def _contains_formula(values: list[Any]) -> bool:
-        for value in values:
-            if isinstance(value, str) and value.strip().startswith("="):
-                return True
-        return False
+        return any(_is_formula(value) for value in values)
 
-    def _open_workbook(self, file_path: Path, *, data_only: bool = False):
+    def _open_workbook(self, file_path: Path, *, data_only: bool = False, read_only: bool = False):
+        if read_only:
+            return load_workbook(file_path, read_only=True, data_only=data_only, keep_links=False)
         keep_vba = file_path.suffix.lower() == ".xlsm" and not data_only
         return load_workbook(file_path, data_only=data_only, keep_vba=keep_vba)
 
+    @staticmethod
+    def _file_state(file_path: Path) -> tuple[int, int]:
+        stat = file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_only_workbook(self, file_path: Path):
+        """Return a cached read-only handle for list_sheets/read, reopening when the file changes."""
+        state = self._file_state(file_path)
+        with self._read_only_cache_lock:
+            cached = self._read_only_cache.get(file_path)
+            if cached is not None and cached[0] == state:
+                self._read_only_cache.move_to_end(file_path)
+                return cached[1]
+
+        workbook = self._open_workbook(file_path, data_only=True, read_only=True)
+        with self._read_only_cache_lock:
+            # Evicted handles are dropped rather than closed: another read may still be
+            # streaming from them, and the archive is closed once the last reference goes.
+            self._read_only_cache[file_path] = (state, workbook)
+            self._read_only_cache.move_to_end(file_path)
+            while len(self._read_only_cache) > READ_ONLY_CACHE_MAX_ENTRIES:
+                self._read_only_cache.popitem(last=False)
+        return workbook
+
+    async def _save_workbook(self, workbook, file_path: Path) -> None:  # noqa: ANN001
+        await asyncio.to_thread(workbook.save, file_path)
+        with self._read_only_cache_lock:
+            self._read_only_cache.pop(file_path, None)
+
+    def _recalc_report(self, file_path: Path) -> dict[str, Any]:
+        """Recalculate and validate, reusing the last report while the file is unchanged."""
+        key = (file_path, *self._file_state(file_path))
+        with self._recalc_cache_lock:
+            cached = self._recalc_cache.get(key)
+            if cached is not None:
+                self._recalc_cache.move_to_end(key)
+                return cached
+
+        report = self.recalc_engine.recalc_and_validate(file_path)
+        if not report.get("ok"):
+            return report
+        # A successful recalc may rewrite the workbook, so key the report on the state it left behind.
+        try:
+            key = (file_path, *self._file_state(file_path))
+        except OSError:
+            return report
+        with self._recalc_cache_lock:
+            self._recalc_cache[key] = report
+            self._recalc_cache.move_to_end(key)
+            while len(self._recalc_cache) > RECALC_CACHE_MAX_ENTRIES:
+                self._recalc_cache.popitem(last=False)
+        return report
+
     def _recalc_summary_text(self, report: dict[str, Any]) -> str:
         total_errors = int(report.get("total_errors") or 0)
         formula_count = int(report.get("formula_count") or 0)
@@ -243,7 +453,7 @@ class ExcelTool(BaseTool):
     def _auto_recalc_after_formula_write(self, file_path: Path) -> tuple[ToolResult | None, dict[str, Any] | None]:
         if not self.settings.excel_recalc_enabled:
             return None, None
-        report = self.recalc_engine.recalc_and_validate(file_path)
+        report = self._recalc_report(file_path)
         if not report.get("ok"):
             return ToolResult(ok=False, content=f"Formula validation failed: {report.get('error','unknown recalc error')}"), report
 
@@ -261,607 +471,624 @@ class ExcelTool(BaseTool):
             )
         return None, report
 
-    async def run(self, args: dict[str, Any]) -> ToolResult:
-        action = str(args.get("action") or "")
-        raw_path = str(args.get("path") or "").strip()
-
-        if action in {
-            "create",
-            "list_sheets",
-            "read",
-            "write_cells",
-            "append_rows",
-            "add_sheet",
-            "convert",
-            "clean_table",
-            "set_number_format",
-            "set_style",
-            "add_comment",
-            "create_chart",
-            "recalc_validate",
-        } and not raw_path:
-            return ToolResult(ok=False, content="path is required")
-
+    async def _create(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        sheet_name = str(args.get("sheet_name") or "Sheet1").strip() or "Sheet1"
+        if file_path.suffix.lower() not in {".xlsx", ".xlsm"}:
+            file_path = file_path.with_suffix(".xlsx")
+        if not args.get("confirmed"):
+            return self._confirmation("create", args, [f"path={file_path}", f"sheet_name={sheet_name}"])
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        workbook = Workbook(write_only=True)
         try:
-            file_path = self._resolve_workspace_path(raw_path) if raw_path else None
-        except PermissionError as exc:
-            return ToolResult(ok=False, content=f"path rejected: {exc}")
-
-        if action == "create":
-            assert file_path is not None
-            sheet_name = str(args.get("sheet_name") or "Sheet1").strip() or "Sheet1"
-            if file_path.suffix.lower() not in {".xlsx", ".xlsm"}:
-                file_path = file_path.with_suffix(".xlsx")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(
-                        action,
-                        [
-                            f"path={file_path}",
-                            f"sheet_name={sheet_name}",
-                        ],
-                    ),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            workbook = Workbook()
-            worksheet = workbook.active
-            worksheet.title = sheet_name
-            workbook.save(file_path)
+            workbook.create_sheet(sheet_name)
+            await self._save_workbook(workbook, file_path)
+        finally:
             workbook.close()
+        return ToolResult(
+            ok=True,
+            content=f"Workbook created.\npath={file_path}\nsheet={sheet_name}",
+            artifacts=[self._artifact(file_path)],
+        )
+
+    @_requires_existing_workbook
+    async def _list_sheets(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        names = await asyncio.to_thread(_sheet_names_from_archive, file_path)
+        if names is None:
+            workbook = await asyncio.to_thread(self._read_only_workbook, file_path)
+            names = workbook.sheetnames
+        return ToolResult(ok=True, content="Sheets:\n" + "\n".join(f"- {name}" for name in names))
+
+    @_requires_existing_workbook
+    async def _read(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        workbook = await asyncio.to_thread(self._read_only_workbook, file_path)
+        sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
+        if sheet_name not in workbook.sheetnames:
+            return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
+        ws = workbook[sheet_name]
+        range_a1 = str(args.get("range") or "").strip()
+        # Value tuples go straight to the serializer, which renders temporal cells via _json_default.
+        if range_a1:
+            rows = await asyncio.to_thread(_read_range, ws, range_a1)
             return ToolResult(
                 ok=True,
-                content=f"Workbook created.\npath={file_path}\nsheet={sheet_name}",
-                artifacts=[self._artifact(file_path)],
+                content=(
+                    f"Workbook read.\npath={file_path}\nsheet={sheet_name}\nrange={range_a1}\n"
+                    f"values={_json_dumps(rows)}"
+                ),
             )
 
-        if action == "list_sheets":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            workbook = self._open_workbook(file_path)
-            try:
-                names = workbook.sheetnames
-            finally:
-                workbook.close()
-            return ToolResult(ok=True, content="Sheets:\n" + "\n".join(f"- {name}" for name in names))
+        rows = await asyncio.to_thread(_read_window, ws)
+        return ToolResult(
+            ok=True,
+            content=(
+                f"Workbook read.\npath={file_path}\nsheet={sheet_name}\n"
+                f"values={_json_dumps(rows)}"
+            ),
+        )
 
-        if action == "read":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            workbook = self._open_workbook(file_path, data_only=True)
-            try:
-                sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
-                if sheet_name not in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
-                ws = workbook[sheet_name]
-                range_a1 = str(args.get("range") or "").strip()
-                if range_a1:
-                    cells = ws[range_a1]
-                    if not isinstance(cells, tuple):
-                        rows = [[cells.value]]
-                    else:
-                        rows = [[cell.value for cell in row] for row in cells]
-                    safe_rows = _json_safe_rows(rows)
-                    return ToolResult(
-                        ok=True,
-                        content=(
-                            f"Workbook read.\npath={file_path}\nsheet={sheet_name}\nrange={range_a1}\n"
-                            f"values={json.dumps(safe_rows, ensure_ascii=False)}"
-                        ),
-                    )
-
-                out_rows: list[list[Any]] = []
-                for row in ws.iter_rows(min_row=1, max_row=min(ws.max_row, 60), max_col=min(ws.max_column, 18)):
-                    out_rows.append([cell.value for cell in row])
-                safe_rows = _json_safe_rows(out_rows)
-                return ToolResult(
-                    ok=True,
-                    content=(
-                        f"Workbook read.\npath={file_path}\nsheet={sheet_name}\n"
-                        f"values={json.dumps(safe_rows, ensure_ascii=False)}"
-                    ),
-                )
-            finally:
-                workbook.close()
+    @_requires_existing_workbook
+    async def _add_sheet(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        sheet_name = str(args.get("sheet_name") or "").strip()
+        if not sheet_name:
+            return ToolResult(ok=False, content="sheet_name is required")
+        if not args.get("confirmed"):
+            return self._confirmation("add_sheet", args, [f"path={file_path}", f"sheet_name={sheet_name}"])
+        workbook = await asyncio.to_thread(self._open_workbook, file_path)
+        try:
+            if sheet_name in workbook.sheetnames:
+                return ToolResult(ok=False, content=f"sheet already exists: {sheet_name}")
+            workbook.create_sheet(sheet_name)
+            await self._save_workbook(workbook, file_path)
+        finally:
+            workbook.close()
+        return ToolResult(
+            ok=True,
+            content=f"Sheet added.\npath={file_path}\nsheet={sheet_name}",
+            artifacts=[self._artifact(file_path)],
+        )
 
-        if action == "add_sheet":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            sheet_name = str(args.get("sheet_name") or "").strip()
-            if not sheet_name:
-                return ToolResult(ok=False, content="sheet_name is required")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}", f"sheet_name={sheet_name}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-            workbook = self._open_workbook(file_path)
-            try:
-                if sheet_name in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet already exists: {sheet_name}")
-                workbook.create_sheet(sheet_name)
-                workbook.save(file_path)
-            finally:
-                workbook.close()
-            return ToolResult(
-                ok=True,
-                content=f"Sheet added.\npath={file_path}\nsheet={sheet_name}",
-                artifacts=[self._artifact(file_path)],
-            )
+    @_requires_existing_workbook
+    async def _write_cells(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        raw_cells = args.get("cells")
+        payload_error = self._payload_error("cells", raw_cells)
+        if payload_error is not None:
+            return payload_error
+        cells = self._load_cells(raw_cells)
+        if not cells:
+            return ToolResult(ok=False, content="cells must be a JSON object mapping cell => value")
+        count_error = self._cell_count_error(len(cells))
+        if count_error is not None:
+            return count_error
+        if not args.get("confirmed"):
+            return self._confirmation("write_cells", args, [f"path={file_path}", f"cells={len(cells)}"])
+
+        # Parse each A1 key once and write by index; ws[ref] = value re-parses the
+        # reference through range_boundaries for every cell.
+        try:
+            positions = [(*_cell_position(cell_ref), value) for cell_ref, value in cells.items()]
+        except (CellCoordinatesException, ValueError) as exc:
+            return ToolResult(ok=False, content=f"invalid cell reference: {exc}")
 
-        if action == "write_cells":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            cells = self._load_cells(args.get("cells"))
-            if not cells:
-                return ToolResult(ok=False, content="cells must be a JSON object mapping cell => value")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}", f"cells={len(cells)}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-
-            workbook = self._open_workbook(file_path)
-            formula_written = False
+        workbook = await asyncio.to_thread(self._open_workbook, file_path)
+        formula_written = False
+        try:
+            sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
+            if sheet_name not in workbook.sheetnames:
+                return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
+            ws = workbook[sheet_name]
+            for row, column, value in positions:
+                ws.cell(row=row, column=column, value=value)
+                formula_written = formula_written or _is_formula(value)
+            await self._save_workbook(workbook, file_path)
+        finally:
+            workbook.close()
+        # Drop the cell model before the recalc subprocess runs; otherwise this frame keeps
+        # the whole parsed workbook alive for the duration of the recalculation.
+        del workbook, ws
+
+        recalc_failure, recalc_report = (
+            await asyncio.to_thread(self._auto_recalc_after_formula_write, file_path)
+            if formula_written
+            else (None, None)
+        )
+        if recalc_failure is not None:
+            return recalc_failure
+
+        content = f"Cells updated.\npath={file_path}\nsheet={sheet_name}\nupdated={len(cells)}"
+        if formula_written and recalc_report and recalc_report.get("ok"):
+            content += "\n" + self._recalc_summary_text(recalc_report)
+
+        return ToolResult(ok=True, content=content, artifacts=[self._artifact(file_path)])
+
+    @_requires_existing_workbook
+    async def _append_rows(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        raw_rows = args.get("rows")
+        payload_error = self._payload_error("rows", raw_rows)
+        if payload_error is not None:
+            return payload_error
+        rows = _to_rows(raw_rows)
+        if rows is None:
+            return ToolResult(ok=False, content="rows must be a 2D array (or JSON string)")
+        count_error = self._cell_count_error(sum(len(row) for row in rows))
+        if count_error is not None:
+            return count_error
+        if not args.get("confirmed"):
+            return self._confirmation("append_rows", args, [f"path={file_path}", f"rows={len(rows)}"])
+
+        workbook = await asyncio.to_thread(self._open_workbook, file_path)
+        formula_written = False
+        try:
+            sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
+            if sheet_name not in workbook.sheetnames:
+                return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
+            ws = workbook[sheet_name]
+            # Repeated category values decoded from JSON are distinct str objects; share one
+            # instance per value so the loaded workbook holds each string once.
+            strings: dict[str, str] = {}
+            for row in rows:
+                row = [strings.setdefault(value, value) if isinstance(value, str) else value for value in row]
+                ws.append(row)
+                formula_written = formula_written or self._contains_formula(row)
+            await self._save_workbook(workbook, file_path)
+        finally:
+            workbook.close()
+        # Drop the cell model before the recalc subprocess runs; otherwise this frame keeps
+        # the whole parsed workbook alive for the duration of the recalculation.
+        del workbook, ws
+
+        recalc_failure, recalc_report = (
+            await asyncio.to_thread(self._auto_recalc_after_formula_write, file_path)
+            if formula_written
+            else (None, None)
+        )
+        if recalc_failure is not None:
+            return recalc_failure
+
+        content = f"Rows appended.\npath={file_path}\nsheet={sheet_name}\nrows={len(rows)}"
+        if formula_written and recalc_report and recalc_report.get("ok"):
+            content += "\n" + self._recalc_summary_text(recalc_report)
+        return ToolResult(ok=True, content=content, artifacts=[self._artifact(file_path)])
+
+    async def _convert(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        if not file_path.exists() or not file_path.is_file():
+            return ToolResult(ok=False, content=f"input file not found: {file_path}")
+        raw_output = str(args.get("output_path") or "").strip()
+        if raw_output:
             try:
-                sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
-                if sheet_name not in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
-                ws = workbook[sheet_name]
-                for cell_ref, value in cells.items():
-                    ws[str(cell_ref)] = value
-                    formula_written = formula_written or (
-                        isinstance(value, str) and value.strip().startswith("=")
-                    )
-                workbook.save(file_path)
-            finally:
-                workbook.close()
-
-            recalc_failure, recalc_report = (
-                self._auto_recalc_after_formula_write(file_path) if formula_written else (None, None)
+                output_path = self._resolve_workspace_path(raw_output)
+            except PermissionError as exc:
+                return ToolResult(ok=False, content=f"output path rejected: {exc}")
+        else:
+            default_suffix = ".xlsx"
+            if file_path.suffix.lower() in {".xlsx", ".xlsm"}:
+                default_suffix = ".csv"
+            output_path = file_path.with_suffix(default_suffix)
+
+        if output_path.suffix.lower() not in {".xlsx", ".xlsm", ".csv", ".tsv"}:
+            return ToolResult(ok=False, content="output extension must be one of: .xlsx, .xlsm, .csv, .tsv")
+
+        if not args.get("confirmed"):
+            return self._confirmation("convert", args, [f"input={file_path}", f"output={output_path}"])
+
+        input_suffix = file_path.suffix.lower()
+        output_suffix = output_path.suffix.lower()
+        sheet_name = str(args.get("sheet") or "").strip() or "Sheet1"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if input_suffix in {".xlsx", ".xlsm"} and output_suffix in {".csv", ".tsv"}:
+            workbook = await asyncio.to_thread(self._read_only_workbook, file_path)
+            sep = "\t" if output_suffix == ".tsv" else ","
+            if str(args.get("sheet") or "").strip() == ALL_SHEETS:
+                return await self._convert_all_sheets(workbook, file_path, output_path, sep)
+            selector = _sheet_selector(args.get("sheet"))
+            if isinstance(selector, int):
+                if not 0 <= selector < len(workbook.worksheets):
+                    return ToolResult(ok=False, content=f"sheet not found: {selector}")
+                ws = workbook.worksheets[selector]
+            else:
+                if selector not in workbook.sheetnames:
+                    return ToolResult(ok=False, content=f"sheet not found: {selector}")
+                ws = workbook[selector]
+            await asyncio.to_thread(_write_delimited, ws, output_path, sep)
+        elif input_suffix in {".csv", ".tsv"} and output_suffix in {".xlsx", ".xlsm"}:
+            import pandas as pd  # noqa: PLC0415
+
+            sep = "\t" if input_suffix == ".tsv" else ","
+            df = await asyncio.to_thread(pd.read_csv, file_path, sep=sep)
+            await asyncio.to_thread(
+                df.to_excel, output_path, index=False, sheet_name=sheet_name, engine=_excel_engine(output_path)
             )
-            if recalc_failure is not None:
-                return recalc_failure
-
-            content = f"Cells updated.\npath={file_path}\nsheet={sheet_name}\nupdated={len(cells)}"
-            if formula_written and recalc_report and recalc_report.get("ok"):
-                content += "\n" + self._recalc_summary_text(recalc_report)
-
-            return ToolResult(ok=True, content=content, artifacts=[self._artifact(file_path)])
-
-        if action == "append_rows":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            rows = _to_rows(args.get("rows"))
-            if rows is None:
-                return ToolResult(ok=False, content="rows must be a 2D array (or JSON string)")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}", f"rows={len(rows)}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-
-            workbook = self._open_workbook(file_path)
-            formula_written = False
+        elif input_suffix in {".xlsx", ".xlsm"} and output_suffix in {".xlsx", ".xlsm"}:
+            workbook = await asyncio.to_thread(self._open_workbook, file_path)
             try:
-                sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
-                if sheet_name not in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
-                ws = workbook[sheet_name]
-                for row in rows:
-                    ws.append(row)
-                    formula_written = formula_written or self._contains_formula(row)
-                workbook.save(file_path)
+                await self._save_workbook(workbook, output_path)
             finally:
                 workbook.close()
+        else:
+            return ToolResult(ok=False, content=f"unsupported conversion: {input_suffix} -> {output_suffix}")
 
-            recalc_failure, recalc_report = (
-                self._auto_recalc_after_formula_write(file_path) if formula_written else (None, None)
-            )
-            if recalc_failure is not None:
-                return recalc_failure
-
-            content = f"Rows appended.\npath={file_path}\nsheet={sheet_name}\nrows={len(rows)}"
-            if formula_written and recalc_report and recalc_report.get("ok"):
-                content += "\n" + self._recalc_summary_text(recalc_report)
-            return ToolResult(ok=True, content=content, artifacts=[self._artifact(file_path)])
-
-        if action == "convert":
-            assert file_path is not None
-            if not file_path.exists() or not file_path.is_file():
-                return ToolResult(ok=False, content=f"input file not found: {file_path}")
-            raw_output = str(args.get("output_path") or "").strip()
-            if raw_output:
-                try:
-                    output_path = self._resolve_workspace_path(raw_output)
-                except PermissionError as exc:
-                    return ToolResult(ok=False, content=f"output path rejected: {exc}")
-            else:
-                default_suffix = ".xlsx"
-                if file_path.suffix.lower() in {".xlsx", ".xlsm"}:
-                    default_suffix = ".csv"
-                output_path = file_path.with_suffix(default_suffix)
-
-            if output_path.suffix.lower() not in {".xlsx", ".xlsm", ".csv", ".tsv"}:
-                return ToolResult(ok=False, content="output extension must be one of: .xlsx, .xlsm, .csv, .tsv")
+        return ToolResult(
+            ok=True,
+            content=f"File converted.\ninput={file_path}\noutput={output_path}",
+            artifacts=[self._artifact(output_path)],
+        )
 
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"input={file_path}", f"output={output_path}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-
-            input_suffix = file_path.suffix.lower()
-            output_suffix = output_path.suffix.lower()
-            sheet_name = str(args.get("sheet") or "").strip() or "Sheet1"
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            if input_suffix in {".xlsx", ".xlsm"} and output_suffix in {".csv", ".tsv"}:
-                df = pd.read_excel(file_path, sheet_name=_sheet_selector(args.get("sheet")))
-                sep = "\t" if output_suffix == ".tsv" else ","
-                df.to_csv(output_path, index=False, sep=sep)
-            elif input_suffix in {".csv", ".tsv"} and output_suffix in {".xlsx", ".xlsm"}:
-                sep = "\t" if input_suffix == ".tsv" else ","
-                df = pd.read_csv(file_path, sep=sep)
-                df.to_excel(output_path, index=False, sheet_name=sheet_name)
-            elif input_suffix in {".xlsx", ".xlsm"} and output_suffix in {".xlsx", ".xlsm"}:
-                workbook = self._open_workbook(file_path)
-                try:
-                    workbook.save(output_path)
-                finally:
-                    workbook.close()
-            else:
-                return ToolResult(ok=False, content=f"unsupported conversion: {input_suffix} -> {output_suffix}")
+    async def _convert_all_sheets(
+        self, workbook, file_path: Path, output_path: Path, sep: str  # noqa: ANN001
+    ) -> ToolResult:
+        # Sheet titles cannot contain path separators, so each "<stem>-<title><suffix>" stays
+        # next to output_path inside the workspace.
+        targets = [
+            (ws, output_path.with_name(f"{output_path.stem}-{ws.title}{output_path.suffix}"))
+            for ws in workbook.worksheets
+        ]
+        semaphore = asyncio.Semaphore(CONVERT_SHEET_CONCURRENCY)
+
+        async def _write(ws, target: Path) -> None:  # noqa: ANN001
+            async with semaphore:
+                await asyncio.to_thread(_write_delimited, ws, target, sep)
+
+        await asyncio.gather(*(_write(ws, target) for ws, target in targets))
+        outputs = "\n".join(f"output={target}" for _, target in targets)
+        return ToolResult(
+            ok=True,
+            content=f"File converted.\ninput={file_path}\n{outputs}",
+            artifacts=[self._artifact(target) for _, target in targets],
+        )
 
+    async def _clean_table(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        if not file_path.exists() or not file_path.is_file():
+            return ToolResult(ok=False, content=f"input file not found: {file_path}")
+        raw_output = str(args.get("output_path") or "").strip()
+        try:
+            output_path = self._resolve_workspace_path(raw_output) if raw_output else file_path
+        except PermissionError as exc:
+            return ToolResult(ok=False, content=f"output path rejected: {exc}")
+
+        input_suffix = file_path.suffix.lower()
+        output_suffix = output_path.suffix.lower()
+        if input_suffix not in {".xlsx", ".xlsm", ".csv", ".tsv"}:
+            return ToolResult(ok=False, content=f"unsupported input extension: {input_suffix}")
+        if output_suffix not in {".xlsx", ".csv", ".tsv"}:
+            return ToolResult(ok=False, content="clean_table output must be .xlsx, .csv, or .tsv")
+        if input_suffix == ".xlsm" and output_path == file_path:
             return ToolResult(
-                ok=True,
-                content=f"File converted.\ninput={file_path}\noutput={output_path}",
-                artifacts=[self._artifact(output_path)],
+                ok=False,
+                content="clean_table on .xlsm requires output_path to avoid macro-loss overwrite",
             )
 
-        if action == "clean_table":
-            assert file_path is not None
-            if not file_path.exists() or not file_path.is_file():
-                return ToolResult(ok=False, content=f"input file not found: {file_path}")
-            raw_output = str(args.get("output_path") or "").strip()
-            try:
-                output_path = self._resolve_workspace_path(raw_output) if raw_output else file_path
-            except PermissionError as exc:
-                return ToolResult(ok=False, content=f"output path rejected: {exc}")
-
-            input_suffix = file_path.suffix.lower()
-            output_suffix = output_path.suffix.lower()
-            if input_suffix not in {".xlsx", ".xlsm", ".csv", ".tsv"}:
-                return ToolResult(ok=False, content=f"unsupported input extension: {input_suffix}")
-            if output_suffix not in {".xlsx", ".csv", ".tsv"}:
-                return ToolResult(ok=False, content="clean_table output must be .xlsx, .csv, or .tsv")
-            if input_suffix == ".xlsm" and output_path.resolve() == file_path.resolve():
-                return ToolResult(
-                    ok=False,
-                    content="clean_table on .xlsm requires output_path to avoid macro-loss overwrite",
-                )
-
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"input={file_path}", f"output={output_path}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-
-            sheet_arg = str(args.get("sheet") or "").strip()
-            if input_suffix in {".xlsx", ".xlsm"}:
-                df = pd.read_excel(file_path, sheet_name=sheet_arg or 0)
-            else:
-                df = pd.read_csv(file_path, sep="\t" if input_suffix == ".tsv" else ",")
-
-            if bool(args.get("drop_empty_rows", True)):
-                df = df.dropna(axis=0, how="all")
-            if bool(args.get("drop_empty_cols", True)):
-                df = df.dropna(axis=1, how="all")
-
-            if bool(args.get("normalize_headers", True)):
-                dedupe: dict[str, int] = {}
-                headers: list[str] = []
-                for col in df.columns:
-                    base = _normalize_header(col)
-                    idx = dedupe.get(base, 0)
-                    dedupe[base] = idx + 1
-                    headers.append(base if idx == 0 else f"{base}_{idx+1}")
-                df.columns = headers
-
-            if bool(args.get("normalize_types", False)):
-                for col in df.columns:
-                    series = df[col]
-                    if series.dtype != "object":
-                        continue
-                    numeric = pd.to_numeric(series, errors="coerce")
-                    if numeric.notna().sum() >= max(1, int(len(series) * 0.8)):
-                        df[col] = numeric
-                        continue
-                    datelike = pd.to_datetime(series, errors="coerce")
-                    if datelike.notna().sum() >= max(1, int(len(series) * 0.8)):
-                        df[col] = datelike
-
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            if output_suffix == ".xlsx":
-                df.to_excel(output_path, index=False, sheet_name=sheet_arg or "Cleaned")
-            elif output_suffix == ".tsv":
-                df.to_csv(output_path, index=False, sep="\t")
-            else:
-                df.to_csv(output_path, index=False)
+        if not args.get("confirmed"):
+            return self._confirmation("clean_table", args, [f"input={file_path}", f"output={output_path}"])
+
+        import pandas as pd  # noqa: PLC0415
+
+        sheet_arg = str(args.get("sheet") or "").strip()
+        if input_suffix in {".xlsx", ".xlsm"}:
+            # pandas' openpyxl reader already opens read_only/data_only; naming the engine skips the
+            # format sniff that otherwise reopens the archive to pick one.
+            df = await asyncio.to_thread(pd.read_excel, file_path, sheet_name=sheet_arg or 0, engine="openpyxl")
+        else:
+            df = await asyncio.to_thread(pd.read_csv, file_path, sep="\t" if input_suffix == ".tsv" else ",")
+
+        if bool(args.get("drop_empty_rows", True)):
+            df = df.dropna(axis=0, how="all")
+        if bool(args.get("drop_empty_cols", True)):
+            df = df.dropna(axis=1, how="all")
+
+        if bool(args.get("normalize_headers", True)):
+            dedupe: dict[str, int] = {}
+            headers: list[str] = []
+            for col in df.columns:
+                base = _normalize_header(col)
+                idx = dedupe.get(base, 0)
+                dedupe[base] = idx + 1
+                headers.append(base if idx == 0 else f"{base}_{idx+1}")
+            df.columns = headers
+
+        if bool(args.get("normalize_types", False)):
+            # Object columns that already hold only numbers, booleans or datetimes convert in
+            # one cheap pass; only columns still holding strings pay for the coercing parsers.
+            df = df.infer_objects()
+            threshold = max(1, int(len(df.index) * 0.8))
+            for col in df.select_dtypes(include=["object", "string"]).columns:
+                series = df[col]
+                numeric = pd.to_numeric(series, errors="coerce")
+                if numeric.notna().sum() >= threshold:
+                    df[col] = numeric
+                    continue
+                datelike = pd.to_datetime(series, errors="coerce")
+                if datelike.notna().sum() >= threshold:
+                    df[col] = datelike
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_suffix == ".xlsx":
+            await asyncio.to_thread(
+                df.to_excel,
+                output_path,
+                index=False,
+                sheet_name=sheet_arg or "Cleaned",
+                engine=_excel_engine(output_path),
+            )
+        else:
+            sep = "\t" if output_suffix == ".tsv" else ","
+            await asyncio.to_thread(_write_frame_delimited, df, output_path, sep)
+
+        return ToolResult(
+            ok=True,
+            content=(
+                "Table cleaned.\n"
+                f"input={file_path}\noutput={output_path}\n"
+                f"rows={len(df.index)} cols={len(df.columns)}"
+            ),
+            artifacts=[self._artifact(output_path)],
+        )
 
-            return ToolResult(
-                ok=True,
-                content=(
-                    "Table cleaned.\n"
-                    f"input={file_path}\noutput={output_path}\n"
-                    f"rows={len(df.index)} cols={len(df.columns)}"
-                ),
-                artifacts=[self._artifact(output_path)],
+    @_requires_existing_workbook
+    async def _set_number_format(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        range_a1 = str(args.get("range") or "").strip()
+        number_format = str(args.get("number_format") or args.get("format") or "").strip()
+        if not range_a1:
+            return ToolResult(ok=False, content="range is required")
+        if not number_format:
+            return ToolResult(ok=False, content="number_format is required")
+        if not args.get("confirmed"):
+            return self._confirmation(
+                "set_number_format", args, [f"path={file_path}", f"range={range_a1}", f"format={number_format}"]
             )
 
-        if action == "set_number_format":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            range_a1 = str(args.get("range") or "").strip()
-            number_format = str(args.get("number_format") or args.get("format") or "").strip()
-            if not range_a1:
-                return ToolResult(ok=False, content="range is required")
-            if not number_format:
-                return ToolResult(ok=False, content="number_format is required")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}", f"range={range_a1}", f"format={number_format}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
+        workbook = await asyncio.to_thread(self._open_workbook, file_path)
+        try:
+            sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
+            if sheet_name not in workbook.sheetnames:
+                return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
+            ws = workbook[sheet_name]
+            updated = 0
+            for cell in self._iter_cells_from_range(ws, range_a1):
+                cell.number_format = number_format
+                updated += 1
+            await self._save_workbook(workbook, file_path)
+        finally:
+            workbook.close()
 
-            workbook = self._open_workbook(file_path)
-            try:
-                sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
-                if sheet_name not in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
-                ws = workbook[sheet_name]
-                updated = 0
-                for cell in self._iter_cells_from_range(ws, range_a1):
-                    cell.number_format = number_format
-                    updated += 1
-                workbook.save(file_path)
-            finally:
-                workbook.close()
+        return ToolResult(
+            ok=True,
+            content=f"Number format applied.\npath={file_path}\nsheet={sheet_name}\nrange={range_a1}\nupdated={updated}",
+            artifacts=[self._artifact(file_path)],
+        )
 
-            return ToolResult(
-                ok=True,
-                content=f"Number format applied.\npath={file_path}\nsheet={sheet_name}\nrange={range_a1}\nupdated={updated}",
-                artifacts=[self._artifact(file_path)],
+    @_requires_existing_workbook
+    async def _set_style(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        range_a1 = str(args.get("range") or "").strip()
+        if not range_a1:
+            return ToolResult(ok=False, content="range is required")
+
+        preset = str(args.get("preset") or "").strip().lower()
+        font_name = str(args.get("font_name") or "").strip()
+        font_size = args.get("font_size")
+        bold = args.get("bold")
+        italic = args.get("italic")
+        font_color = str(args.get("font_color") or "").strip()
+        fill_color = str(args.get("fill_color") or "").strip()
+        horizontal = str(args.get("horizontal") or "").strip()
+        vertical = str(args.get("vertical") or "").strip()
+
+        if preset == "professional":
+            if not font_name:
+                font_name = "Arial"
+            if font_size is None:
+                font_size = 10
+
+        if not args.get("confirmed"):
+            return self._confirmation("set_style", args, [f"path={file_path}", f"range={range_a1}"])
+
+        workbook = await asyncio.to_thread(self._open_workbook, file_path)
+        try:
+            sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
+            if sheet_name not in workbook.sheetnames:
+                return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
+            ws = workbook[sheet_name]
+            updated = 0
+            # copy() on an openpyxl style round-trips it through XML, and a range usually shares
+            # a handful of fonts/alignments. Restyle each distinct source entry once, keyed by its
+            # index in the workbook style tables, and reuse the result for every matching cell.
+            fonts: dict[int, Font] = {}
+            alignments: dict[int, Alignment] = {}
+            fill = PatternFill(fill_type="solid", start_color=fill_color, end_color=fill_color) if fill_color else None
+            font_dirty = bool(
+                font_name
+                or isinstance(font_size, (int, float))
+                or isinstance(bold, bool)
+                or isinstance(italic, bool)
+                or font_color
             )
-
-        if action == "set_style":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            range_a1 = str(args.get("range") or "").strip()
-            if not range_a1:
-                return ToolResult(ok=False, content="range is required")
-
-            preset = str(args.get("preset") or "").strip().lower()
-            font_name = str(args.get("font_name") or "").strip()
-            font_size = args.get("font_size")
-            bold = args.get("bold")
-            italic = args.get("italic")
-            font_color = str(args.get("font_color") or "").strip()
-            fill_color = str(args.get("fill_color") or "").strip()
-            horizontal = str(args.get("horizontal") or "").strip()
-            vertical = str(args.get("vertical") or "").strip()
-
-            if preset == "professional":
-                if not font_name:
-                    font_name = "Arial"
-                if font_size is None:
-                    font_size = 10
-
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}", f"range={range_a1}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-
-            workbook = self._open_workbook(file_path)
-            try:
-                sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
-                if sheet_name not in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
-                ws = workbook[sheet_name]
-                updated = 0
-                for cell in self._iter_cells_from_range(ws, range_a1):
-                    style_font = copy(cell.font)
-                    if font_name:
-                        style_font.name = font_name
-                    if isinstance(font_size, (int, float)):
-                        style_font.sz = float(font_size)
-                    if isinstance(bold, bool):
-                        style_font.bold = bold
-                    if isinstance(italic, bool):
-                        style_font.italic = italic
-                    if font_color:
-                        style_font.color = font_color
+            for cell in self._iter_cells_from_range(ws, range_a1):
+                # Unstyled cells have no StyleArray yet; they use entry 0 of every style table.
+                style_ids = cell._style if cell._style is not None else _DEFAULT_STYLE_IDS
+                before = (style_ids.fontId, style_ids.fillId, style_ids.alignmentId)
+                if font_dirty:
+                    style_font = fonts.get(style_ids.fontId)
+                    if style_font is None:
+                        style_font = copy(cell.font)
+                        if font_name:
+                            style_font.name = font_name
+                        if isinstance(font_size, (int, float)):
+                            style_font.sz = float(font_size)
+                        if isinstance(bold, bool):
+                            style_font.bold = bold
+                        if isinstance(italic, bool):
+                            style_font.italic = italic
+                        if font_color:
+                            style_font.color = font_color
+                        fonts[style_ids.fontId] = style_font
                     cell.font = style_font
 
-                    if fill_color:
-                        cell.fill = PatternFill(fill_type="solid", start_color=fill_color, end_color=fill_color)
+                if fill is not None:
+                    cell.fill = fill
 
-                    if horizontal or vertical:
+                if horizontal or vertical:
+                    align = alignments.get(style_ids.alignmentId)
+                    if align is None:
                         align = copy(cell.alignment)
                         if horizontal:
                             align.horizontal = horizontal
                         if vertical:
                             align.vertical = vertical
-                        cell.alignment = align
+                        alignments[style_ids.alignmentId] = align
+                    cell.alignment = align
 
+                # The style tables dedupe equal entries, so an override that matches what the
+                # cell already has leaves its ids unchanged.
+                after = cell._style if cell._style is not None else _DEFAULT_STYLE_IDS
+                if (after.fontId, after.fillId, after.alignmentId) != before:
                     updated += 1
-                workbook.save(file_path)
-            finally:
-                workbook.close()
+            if updated:
+                await self._save_workbook(workbook, file_path)
+        finally:
+            workbook.close()
 
-            return ToolResult(
-                ok=True,
-                content=f"Style applied.\npath={file_path}\nsheet={sheet_name}\nrange={range_a1}\nupdated={updated}",
-                artifacts=[self._artifact(file_path)],
-            )
+        headline = "Style applied." if updated else "Style already applied; no changes saved."
+        return ToolResult(
+            ok=True,
+            content=f"{headline}\npath={file_path}\nsheet={sheet_name}\nrange={range_a1}\nupdated={updated}",
+            artifacts=[self._artifact(file_path)],
+        )
 
-        if action == "add_comment":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            cell_ref = str(args.get("cell") or "").strip()
-            comment_text = str(args.get("comment") or "").strip()
-            author = str(args.get("author") or "Nexus").strip() or "Nexus"
-            if not cell_ref:
-                return ToolResult(ok=False, content="cell is required")
-            if not comment_text:
-                return ToolResult(ok=False, content="comment is required")
-
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}", f"cell={cell_ref}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
+    @_requires_existing_workbook
+    async def _add_comment(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        cell_ref = str(args.get("cell") or "").strip()
+        comment_text = str(args.get("comment") or "").strip()
+        author = str(args.get("author") or "Nexus").strip() or "Nexus"
+        if not cell_ref:
+            return ToolResult(ok=False, content="cell is required")
+        if not comment_text:
+            return ToolResult(ok=False, content="comment is required")
 
-            workbook = self._open_workbook(file_path)
-            try:
-                sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
-                if sheet_name not in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
-                ws = workbook[sheet_name]
-                ws[cell_ref].comment = Comment(comment_text, author)
-                workbook.save(file_path)
-            finally:
-                workbook.close()
+        if not args.get("confirmed"):
+            return self._confirmation("add_comment", args, [f"path={file_path}", f"cell={cell_ref}"])
 
-            return ToolResult(
-                ok=True,
-                content=f"Comment added.\npath={file_path}\nsheet={sheet_name}\ncell={cell_ref}",
-                artifacts=[self._artifact(file_path)],
-            )
+        workbook = await asyncio.to_thread(self._open_workbook, file_path)
+        try:
+            sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
+            if sheet_name not in workbook.sheetnames:
+                return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
+            cell = workbook[sheet_name][cell_ref]
+            existing = cell.comment
+            unchanged = existing is not None and existing.text == comment_text and existing.author == author
+            if not unchanged:
+                cell.comment = Comment(comment_text, author)
+                await self._save_workbook(workbook, file_path)
+        finally:
+            workbook.close()
 
-        if action == "create_chart":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            data_range = str(args.get("data_range") or "").strip()
-            chart_type = str(args.get("chart_type") or "").strip().lower() or "line"
-            if not data_range:
-                return ToolResult(ok=False, content="data_range is required")
-            if chart_type not in {"line", "bar", "column"}:
-                return ToolResult(ok=False, content=f"unsupported chart_type: {chart_type}")
-
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}", f"data_range={data_range}", f"chart_type={chart_type}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
+        headline = "Comment already present; no changes saved." if unchanged else "Comment added."
+        return ToolResult(
+            ok=True,
+            content=f"{headline}\npath={file_path}\nsheet={sheet_name}\ncell={cell_ref}",
+            artifacts=[self._artifact(file_path)],
+        )
 
-            category_range = str(args.get("category_range") or "").strip()
-            title = str(args.get("title") or "").strip() or "Chart"
-            position = str(args.get("position") or "E2").strip() or "E2"
+    @_requires_existing_workbook
+    async def _create_chart(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        data_range = str(args.get("data_range") or "").strip()
+        chart_type = str(args.get("chart_type") or "").strip().lower() or "line"
+        if not data_range:
+            return ToolResult(ok=False, content="data_range is required")
+        if chart_type not in {"line", "bar", "column"}:
+            return ToolResult(ok=False, content=f"unsupported chart_type: {chart_type}")
+
+        if not args.get("confirmed"):
+            return self._confirmation(
+                "create_chart", args, [f"path={file_path}", f"data_range={data_range}", f"chart_type={chart_type}"]
+            )
 
-            workbook = self._open_workbook(file_path)
-            try:
-                sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
-                if sheet_name not in workbook.sheetnames:
-                    return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
-                ws = workbook[sheet_name]
+        category_range = str(args.get("category_range") or "").strip()
+        title = str(args.get("title") or "").strip() or "Chart"
+        position = str(args.get("position") or "E2").strip() or "E2"
+
+        workbook = await asyncio.to_thread(self._open_workbook, file_path)
+        try:
+            sheet_name = str(args.get("sheet") or "").strip() or workbook.sheetnames[0]
+            if sheet_name not in workbook.sheetnames:
+                return ToolResult(ok=False, content=f"sheet not found: {sheet_name}")
+            ws = workbook[sheet_name]
 
-                if chart_type == "line":
-                    chart = LineChart()
+            if chart_type == "line":
+                chart = LineChart()
+            else:
+                chart = BarChart()
+                if chart_type == "column":
+                    chart.type = "col"
                 else:
-                    chart = BarChart()
-                    if chart_type == "column":
-                        chart.type = "col"
-                    else:
-                        chart.type = "bar"
-
-                chart.title = title
-                data_ref = Reference(ws, range_string=_qualify_range(sheet_name, data_range))
-                chart.add_data(data_ref, titles_from_data=True)
-
-                if category_range:
-                    cat_ref = Reference(ws, range_string=_qualify_range(sheet_name, category_range))
-                    chart.set_categories(cat_ref)
-
-                ws.add_chart(chart, position)
-                workbook.save(file_path)
-            finally:
-                workbook.close()
+                    chart.type = "bar"
 
-            return ToolResult(
-                ok=True,
-                content=(
-                    "Chart created.\n"
-                    f"path={file_path}\nsheet={sheet_name}\nchart_type={chart_type}\n"
-                    f"data_range={data_range}\nposition={position}"
-                ),
-                artifacts=[self._artifact(file_path)],
-            )
+            chart.title = title
+            data_ref = Reference(ws, range_string=_qualify_range(sheet_name, data_range))
+            chart.add_data(data_ref, titles_from_data=True)
 
-        if action == "recalc_validate":
-            assert file_path is not None
-            if not file_path.exists():
-                return ToolResult(ok=False, content=f"workbook not found: {file_path}")
-            if not args.get("confirmed"):
-                return ToolResult(
-                    ok=False,
-                    content=self._write_preview(action, [f"path={file_path}"]),
-                    requires_confirmation=True,
-                    risk_level="high",
-                    proposed_action={"action": action, **args},
-                )
-            report = self.recalc_engine.recalc_and_validate(file_path)
-            if not report.get("ok"):
-                return ToolResult(ok=False, content=f"Recalc failed: {report.get('error','unknown error')}")
-            total_errors = int(report.get("total_errors") or 0)
-            ok = (not self.settings.excel_strict_formula_errors) or total_errors == 0
-            return ToolResult(
-                ok=ok,
-                content=(
-                    "Recalculation complete.\n"
-                    f"path={file_path}\n{self._recalc_summary_text(report)}"
-                ),
-                artifacts=[self._artifact(file_path)] if ok else [],
-            )
+            if category_range:
+                cat_ref = Reference(ws, range_string=_qualify_range(sheet_name, category_range))
+                chart.set_categories(cat_ref)
+
+            ws.add_chart(chart, position)
+            await self._save_workbook(workbook, file_path)
+        finally:
+            workbook.close()
 
-        return ToolResult(ok=False, content=f"Unsupported action: {action}")
+        return ToolResult(
+            ok=True,
+            content=(
+                "Chart created.\n"
+                f"path={file_path}\nsheet={sheet_name}\nchart_type={chart_type}\n"
+                f"data_range={data_range}\nposition={position}"
+            ),
+            artifacts=[self._artifact(file_path)],
+        )
+
+    @_requires_existing_workbook
+    async def _recalc_validate(self, file_path: Path, args: dict[str, Any]) -> ToolResult:
+        if not args.get("confirmed"):
+            return self._confirmation("recalc_validate", args, [f"path={file_path}"])
+        report = await asyncio.to_thread(self._recalc_report, file_path)
+        if not report.get("ok"):
+            return ToolResult(ok=False, content=f"Recalc failed: {report.get('error','unknown error')}")
+        total_errors = int(report.get("total_errors") or 0)
+        ok = (not self.settings.excel_strict_formula_errors) or total_errors == 0
+        return ToolResult(
+            ok=ok,
+            content=(
+                "Recalculation complete.\n"
+                f"path={file_path}\n{self._recalc_summary_text(report)}"
+            ),
+            artifacts=[self._artifact(file_path)] if ok else [],
+        )
+
+    _HANDLERS: dict[str, _Handler] = {
+        "create": _create,
+        "list_sheets": _list_sheets,
+        "read": _read,
+        "add_sheet": _add_sheet,
+        "write_cells": _write_cells,
+        "append_rows": _append_rows,
+        "convert": _convert,
+        "clean_table": _clean_table,
+        "set_number_format": _set_number_format,
+        "set_style": _set_style,
+        "add_comment": _add_comment,
+        "create_chart": _create_chart,
+        "recalc_validate": _recalc_validate,
+    }
+
+    async def run(self, args: dict[str, Any]) -> ToolResult:
+        action = str(args.get("action") or "")
+        handler = self._HANDLERS.get(action)
+        if handler is None:
+            return ToolResult(ok=False, content=f"Unsupported action: {action}")
+
+        raw_path = str(args.get("path") or "").strip()
+        if not raw_path:
+            return ToolResult(ok=False, content="path is required")
+        try:
+            file_path = self._resolve_workspace_path(raw_path)
+        except PermissionError as exc:
+            return ToolResult(ok=False, content=f"path rejected: {exc}")
+        return await handler(self, file_path, args)
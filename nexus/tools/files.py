@@ -1,11 +1,71 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import re
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 from nexus.tools.base import BaseTool, ToolResult, ToolSpec
 
+GREP_MAX_MATCHES = 200
+GREP_MAX_FILE_BYTES = 10 * 1024 * 1024
+GREP_BINARY_SNIFF_BYTES = 8192
+GREP_MAX_SKIPPED_LISTED = 10
+GREP_SKIP_DIRS = frozenset({".git", ".hg", ".svn"})
+
+
+def _iter_files(root: Path):
+    """Yield regular files under ``root`` using cached dirent types, without following symlinks."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in GREP_SKIP_DIRS:
+                yield from _iter_files(Path(entry.path))
+        elif entry.is_file(follow_symlinks=False):
+            yield Path(entry.path)
+
+
+def _grep_file(file_path: Path, regex: re.Pattern[str], limit: int) -> list[tuple[int, str]] | None:
+    """Return up to ``limit`` (line number, line) pairs matching ``regex``, or None if the file is too large."""
+    hits: list[tuple[int, str]] = []
+    with open(file_path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size > GREP_MAX_FILE_BYTES:
+            return None
+        data = handle.read()
+    # A NUL byte near the start marks a binary file (image, archive, PDF); skip it.
+    if data.find(b"\0", 0, GREP_BINARY_SNIFF_BYTES) != -1:
+        return hits
+    for i, line in enumerate(data.decode("utf-8", errors="ignore").splitlines(), start=1):
+        if regex.search(line):
+            hits.append((i, line))
+            if len(hits) >= limit:
+                break
+    return hits
+
+
+def _grep_files(paths: Iterable[Path], regex: re.Pattern[str], workspace: Path) -> tuple[list[str], list[str]]:
+    """Return formatted hits and the relative paths of files skipped for exceeding the size cap."""
+    found: list[str] = []
+    skipped: list[str] = []
+    for file_path in paths:
+        if len(found) >= GREP_MAX_MATCHES:
+            break
+        try:
+            hits = _grep_file(file_path, regex, GREP_MAX_MATCHES - len(found))
+        except OSError:
+            continue
+        rel = file_path.relative_to(workspace)
+        if hits is None:
+            skipped.append(str(rel))
+            continue
+        found.extend(f"{rel}:{i}:{line.strip()}" for i, line in hits)
+    return found, skipped
+
 
 class FileSystemTool(BaseTool):
     name = "filesystem"
@@ -13,6 +73,8 @@ class FileSystemTool(BaseTool):
     def __init__(self, workspace: Path) -> None:
         self.workspace = workspace.resolve()
         self.workspace.mkdir(parents=True, exist_ok=True)
+        self._workspace_str = str(self.workspace)
+        self._workspace_prefix = os.path.join(self._workspace_str, "")
 
     def spec(self) -> ToolSpec:
         return ToolSpec(
@@ -35,10 +97,18 @@ class FileSystemTool(BaseTool):
 
     def _resolve_path(self, path_str: str) -> Path:
         target = (self.workspace / path_str).resolve() if not Path(path_str).is_absolute() else Path(path_str).resolve()
-        if self.workspace not in target.parents and target != self.workspace:
+        target_str = str(target)
+        if target_str != self._workspace_str and not target_str.startswith(self._workspace_prefix):
             raise PermissionError("Path escapes sandbox workspace")
         return target
 
+    def _list_entries(self, path: Path) -> list[str]:
+        entries = []
+        for item in sorted(path.iterdir()):
+            suffix = "/" if item.is_dir() else ""
+            entries.append(str(item.relative_to(self.workspace)) + suffix)
+        return entries
+
     async def run(self, args: dict[str, Any]) -> ToolResult:
         action = args.get("action")
         try:
@@ -46,7 +116,8 @@ class FileSystemTool(BaseTool):
                 path = self._resolve_path(args["path"])
                 if not path.exists():
                     return ToolResult(ok=False, content=f"File not found: {path}")
-                return ToolResult(ok=True, content=path.read_text(encoding="utf-8"))
+                content = await asyncio.to_thread(path.read_text, encoding="utf-8")
+                return ToolResult(ok=True, content=content)
 
             if action == "write_file":
                 path = self._resolve_path(args["path"])
@@ -60,7 +131,7 @@ class FileSystemTool(BaseTool):
                         risk_level="high",
                         proposed_action={"action": action, **args},
                     )
-                path.write_text(args.get("content", ""), encoding="utf-8")
+                await asyncio.to_thread(path.write_text, args.get("content", ""), encoding="utf-8")
                 return ToolResult(ok=True, content=f"Wrote {path}")
 
             if action == "list_dir":
@@ -68,10 +139,7 @@ class FileSystemTool(BaseTool):
                 path = self._resolve_path(rel)
                 if not path.exists():
                     return ToolResult(ok=False, content=f"Directory not found: {path}")
-                entries = []
-                for item in sorted(path.iterdir()):
-                    suffix = "/" if item.is_dir() else ""
-                    entries.append(str(item.relative_to(self.workspace)) + suffix)
+                entries = await asyncio.to_thread(self._list_entries, path)
                 if not entries:
                     return ToolResult(ok=True, content=f"Directory is empty: {path}")
                 return ToolResult(ok=True, content="\n".join(entries))
@@ -82,20 +150,18 @@ class FileSystemTool(BaseTool):
                     return ToolResult(ok=False, content="pattern is required")
                 rel = args.get("path", ".")
                 root = self._resolve_path(rel)
-                found = []
                 regex = re.compile(pattern)
-                for file_path in root.rglob("*"):
-                    if not file_path.is_file():
-                        continue
-                    try:
-                        for i, line in enumerate(
-                            file_path.read_text(encoding="utf-8", errors="ignore").splitlines(), start=1
-                        ):
-                            if regex.search(line):
-                                found.append(f"{file_path.relative_to(self.workspace)}:{i}:{line.strip()}")
-                    except OSError:
-                        continue
-                return ToolResult(ok=True, content="\n".join(found[:200]) or "No matches found")
+                # One lazy walk-and-scan: it stops at the match cap, and the per-line decode and
+                # regex work holds the GIL, so splitting it across threads would only scan more files.
+                found, skipped = await asyncio.to_thread(_grep_files, _iter_files(root), regex, self.workspace)
+                lines = found or ["No matches found"]
+                if skipped:
+                    limit_mib = GREP_MAX_FILE_BYTES // (1024 * 1024)
+                    listed = ", ".join(skipped[:GREP_MAX_SKIPPED_LISTED])
+                    if len(skipped) > GREP_MAX_SKIPPED_LISTED:
+                        listed += f" ... and {len(skipped) - GREP_MAX_SKIPPED_LISTED} more"
+                    lines.append(f"Skipped {len(skipped)} file(s) larger than {limit_mib} MiB: {listed}")
+                return ToolResult(ok=True, content="\n".join(lines))
 
             if action == "delete_file":
                 path = self._resolve_path(args["path"])
@@ -109,7 +175,7 @@ class FileSystemTool(BaseTool):
                         risk_level="high",
                         proposed_action={"action": action, **args},
                     )
-                path.unlink()
+                await asyncio.to_thread(path.unlink)
                 return ToolResult(ok=True, content=f"Deleted {path}")
         except PermissionError as exc:
             return ToolResult(ok=False, content=f"Permission denied: {exc}")
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+SCOPE_GUIDANCE = (
+    "Google connection is missing required scopes for this action. "
+    "Disconnect and reconnect Google from the dashboard."
+)
+
+_SCOPE_ERROR_RE = re.compile(
+    r"insufficient(?: authentication scopes| ?permission)",
+    re.IGNORECASE,
+)
+
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Writes may already have been applied when the server answers 5xx, so only
+# rate-limit rejections are safe to replay for them.
+WRITE_RETRY_STATUSES = frozenset({429})
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 30.0
+
+
+def normalize_google_error(prefix: str, exc: Exception) -> str:
+    message = str(exc)
+    if _SCOPE_ERROR_RE.search(message):
+        return f"{prefix}: {SCOPE_GUIDANCE}"
+    return f"{prefix}: {message}"
+
+
+def _error_status(exc: Exception) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "resp", None), "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    resp = getattr(exc, "resp", None)
+    if not hasattr(resp, "get"):
+        return None
+    try:
+        return max(0.0, float(resp.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+async def call_google_api(
+    func: Callable[..., T],
+    *args: Any,
+    retry_statuses: frozenset[int] = TRANSIENT_STATUSES,
+    **kwargs: Any,
+) -> T:
+    """Call a Google client method, retrying transient HTTP errors with jittered backoff."""
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            if attempt + 1 >= RETRY_ATTEMPTS or _error_status(exc) not in retry_statuses:
+                raise
+            delay = _retry_after_seconds(exc)
+            if delay is None:
+                delay = RETRY_BASE_DELAY_SECONDS * 2**attempt + random.uniform(0, RETRY_BASE_DELAY_SECONDS)
+        attempt += 1
+        await asyncio.sleep(min(delay, RETRY_MAX_DELAY_SECONDS))
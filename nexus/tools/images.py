@@ -19,6 +19,7 @@ class ImagesTool(BaseTool):
     def __init__(self, settings: Settings, client: OpenRouterImageClient | None = None) -> None:
         self.settings = settings
         self.client = client or OpenRouterImageClient(settings)
+        self._workspace_root = settings.workspace.resolve()
 
     def spec(self) -> ToolSpec:
         return ToolSpec(
@@ -48,18 +49,16 @@ class ImagesTool(BaseTool):
     def _resolve_workspace_path(self, raw_path: str) -> Path:
         candidate = Path(raw_path).expanduser()
         if not candidate.is_absolute():
-            candidate = self.settings.workspace / candidate
+            candidate = self._workspace_root / candidate
         resolved = candidate.resolve()
-        workspace = self.settings.workspace.resolve()
-        if workspace != resolved and workspace not in resolved.parents:
+        if not resolved.is_relative_to(self._workspace_root):
             raise PermissionError("path escapes workspace")
         return resolved
 
     def _relative_path_for_display(self, raw_path: str) -> str:
         path = Path(raw_path).expanduser().resolve()
-        workspace = self.settings.workspace.resolve()
         try:
-            return str(path.relative_to(workspace))
+            return str(path.relative_to(self._workspace_root))
         except ValueError:
             return str(path)
 
@@ -80,17 +79,16 @@ class ImagesTool(BaseTool):
 
     @staticmethod
     def _format_artifacts(artifacts: list[dict[str, str]]) -> list[dict[str, str]]:
-        out: list[dict[str, str]] = []
-        for item in artifacts:
-            out.append(
-                {
-                    "type": "image",
-                    "path": str(item.get("path") or ""),
-                    "file_name": str(item.get("file_name") or "image.png"),
-                    "mime_type": str(item.get("mime_type") or "image/png"),
-                }
-            )
-        return [item for item in out if item.get("path")]
+        return [
+            {
+                "type": "image",
+                "path": path,
+                "file_name": item.get("file_name") or "image.png",
+                "mime_type": item.get("mime_type") or "image/png",
+            }
+            for item in artifacts
+            if (path := item.get("path"))
+        ]
 
     @staticmethod
     def _normalize_model(raw: str) -> str:
@@ -152,9 +150,10 @@ class ImagesTool(BaseTool):
             except PermissionError as exc:
                 return ToolResult(ok=False, content=f"input path rejected: {exc}")
 
+        resolved_output = ""
         if output_path:
             try:
-                _ = self._resolve_workspace_path(output_path)
+                resolved_output = str(self._resolve_workspace_path(output_path))
             except PermissionError as exc:
                 return ToolResult(ok=False, content=f"output path rejected: {exc}")
 
@@ -187,7 +186,7 @@ class ImagesTool(BaseTool):
                     model=model,
                     size=size or None,
                     resolution=resolution or None,
-                    output_path=output_path or None,
+                    output_path=resolved_output or None,
                 )
             else:
                 data = self.client.edit(
@@ -196,7 +195,7 @@ class ImagesTool(BaseTool):
                     model=model,
                     size=size or None,
                     resolution=resolution or None,
-                    output_path=output_path or None,
+                    output_path=resolved_output or None,
                 )
         except Exception as exc:  # noqa: BLE001
             if model != DEFAULT_IMAGE_MODEL and self._is_no_endpoint_error(exc):
@@ -207,7 +206,7 @@ class ImagesTool(BaseTool):
                             model=DEFAULT_IMAGE_MODEL,
                             size=size or None,
                             resolution=resolution or None,
-                            output_path=output_path or None,
+                            output_path=resolved_output or None,
                         )
                     else:
                         data = self.client.edit(
@@ -216,7 +215,7 @@ class ImagesTool(BaseTool):
                             model=DEFAULT_IMAGE_MODEL,
                             size=size or None,
                             resolution=resolution or None,
-                            output_path=output_path or None,
+                            output_path=resolved_output or None,
                         )
                     fallback_notice = (
                         f"Requested model `{model}` is unavailable on OpenRouter. "
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -13,7 +18,16 @@ from pypdf import PdfReader, PdfWriter
 from nexus.config import Settings
 from nexus.tools.base import BaseTool, ToolResult, ToolSpec
 
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - PyMuPDF is an optional faster text backend
+    pymupdf = None
+
 PDF_MIME = "application/pdf"
+PDF_READER_CACHE_MAX_ENTRIES = 8
+PDF_WRITE_BUFFER_BYTES = 1 << 20
+MERGE_READ_CONCURRENCY = 8
+EXTRACT_TEXT_MAX_CHARS = 12000
 UNICODE_FONT_CANDIDATES: tuple[tuple[str, str], ...] = (
     ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
     ("/usr/share/fonts/dejavu/DejaVuSans.ttf", "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf"),
@@ -38,6 +52,68 @@ LATIN1_REPLACEMENTS = str.maketrans(
 )
 
 
+def _copy_file(source: Path, target: Path) -> None:
+    """copy2, but let the kernel copy (or reflink, on CoW filesystems) the bytes when it can."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with source.open("rb") as src, target.open("wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(source, target)
+                return
+        except OSError:
+            pass  # e.g. cross-device on older kernels, or unsupported filesystem
+    shutil.copy2(source, target)
+
+
+class _MuPdfPages:
+    __slots__ = ("_doc",)
+
+    def __init__(self, doc: Any) -> None:
+        self._doc = doc
+
+    def __len__(self) -> int:
+        return self._doc.page_count
+
+    def __getitem__(self, index: int) -> _MuPdfPage:
+        return _MuPdfPage(self._doc.load_page(index))
+
+
+class _MuPdfPage:
+    __slots__ = ("_page",)
+
+    def __init__(self, page: Any) -> None:
+        self._page = page
+
+    def extract_text(self) -> str:
+        return self._page.get_text("text")
+
+
+class _MuPdfReader:
+    """The slice of the PdfReader interface inspect/extract_text use, backed by PyMuPDF."""
+
+    _METADATA_KEYS = {
+        "/Title": "title",
+        "/Author": "author",
+        "/Creator": "creator",
+        "/Producer": "producer",
+        "/CreationDate": "creationDate",
+        "/ModDate": "modDate",
+    }
+
+    def __init__(self, file_path: Path) -> None:
+        doc = pymupdf.open(str(file_path))
+        meta = doc.metadata or {}
+        self.pages = _MuPdfPages(doc)
+        self.metadata = {key: meta.get(name) for key, name in self._METADATA_KEYS.items()}
+
+
 def _to_path_list(value: Any) -> list[str]:
     if value is None:
         return []
@@ -58,6 +134,12 @@ class PdfTool(BaseTool):
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        self._workspace_root = settings.workspace.resolve()
+        # path -> ((mtime_ns, size), reader, {page index: extracted text}, lock)
+        self._reader_cache: OrderedDict[
+            Path, tuple[tuple[int, int], PdfReader | _MuPdfReader, dict[int, str], threading.Lock]
+        ] = OrderedDict()
+        self._reader_cache_lock = threading.Lock()
 
     def spec(self) -> ToolSpec:
         return ToolSpec(
@@ -87,13 +169,42 @@ class PdfTool(BaseTool):
     def _resolve_workspace_path(self, raw_path: str) -> Path:
         candidate = Path(raw_path).expanduser()
         if not candidate.is_absolute():
-            candidate = self.settings.workspace / candidate
+            candidate = self._workspace_root / candidate
         resolved = candidate.resolve()
-        workspace = self.settings.workspace.resolve()
-        if workspace != resolved and workspace not in resolved.parents:
+        if not resolved.is_relative_to(self._workspace_root):
             raise PermissionError("path escapes workspace")
         return resolved
 
+    def _cached_reader(self, file_path: Path) -> tuple[PdfReader | _MuPdfReader, dict[int, str], threading.Lock]:
+        """Return a reader, its extracted-text memo and the lock guarding both, reparsing when the file changes."""
+        stat = file_path.stat()
+        state = (stat.st_mtime_ns, stat.st_size)
+        with self._reader_cache_lock:
+            cached = self._reader_cache.get(file_path)
+            if cached is not None and cached[0] == state:
+                self._reader_cache.move_to_end(file_path)
+                return cached[1], cached[2], cached[3]
+
+        # PyMuPDF's C text extraction is far faster; merge and create stay on pypdf/fpdf either way.
+        use_mupdf = self.settings.pdf_use_pymupdf and pymupdf is not None
+        reader = _MuPdfReader(file_path) if use_mupdf else PdfReader(str(file_path))
+        texts: dict[int, str] = {}
+        # A reader seeks a single shared stream, so concurrent calls on one file take turns.
+        lock = threading.Lock()
+        with self._reader_cache_lock:
+            self._reader_cache[file_path] = (state, reader, texts, lock)
+            self._reader_cache.move_to_end(file_path)
+            while len(self._reader_cache) > PDF_READER_CACHE_MAX_ENTRIES:
+                self._reader_cache.popitem(last=False)
+        return reader, texts, lock
+
+    @staticmethod
+    def _page_text(reader: PdfReader | _MuPdfReader, texts: dict[int, str], index: int) -> str:
+        text = texts.get(index)
+        if text is None:
+            text = texts[index] = reader.pages[index].extract_text() or ""
+        return text
+
     @staticmethod
     def _artifact(path: Path) -> dict[str, Any]:
         return {
@@ -187,6 +298,76 @@ class PdfTool(BaseTool):
     def _unicode_font_available() -> bool:
         return any(Path(regular).exists() for regular, _bold in UNICODE_FONT_CANDIDATES)
 
+    def _inspect_pdf(self, file_path: Path) -> ToolResult:
+        reader, texts, lock = self._cached_reader(file_path)
+        with lock:
+            metadata = reader.metadata or {}
+            lines = [f"PDF inspect.\npath={file_path}\npages={len(reader.pages)}"]
+            if metadata:
+                keys = ["/Title", "/Author", "/Creator", "/Producer", "/CreationDate", "/ModDate"]
+                meta_bits = []
+                for key in keys:
+                    value = metadata.get(key)
+                    if value:
+                        meta_bits.append(f"{key[1:].lower()}={value}")
+                if meta_bits:
+                    lines.append("metadata=" + ", ".join(meta_bits))
+
+            previews: list[str] = []
+            for idx in range(min(3, len(reader.pages))):
+                text = self._page_text(reader, texts, idx).strip()
+                if text:
+                    previews.append(f"page_{idx}_preview={text[:240]}")
+        if previews:
+            lines.extend(previews)
+        return ToolResult(ok=True, content="\n".join(lines))
+
+    def _extract_pdf_text(self, file_path: Path, page: Any) -> ToolResult:
+        reader, texts, lock = self._cached_reader(file_path)
+        with lock:
+            if isinstance(page, int):
+                if page < 0 or page >= len(reader.pages):
+                    return ToolResult(ok=False, content=f"page out of range: {page}")
+                text = self._page_text(reader, texts, page)
+                return ToolResult(
+                    ok=True,
+                    content=f"PDF text extracted.\npath={file_path}\npage={page}\n\n{text[:EXTRACT_TEXT_MAX_CHARS]}",
+                )
+            chunks: list[str] = []
+            total = 0
+            for idx in range(len(reader.pages)):
+                text = self._page_text(reader, texts, idx)
+                chunk = f"--- page {idx} ---\n{text}"
+                chunks.append(chunk)
+                total += len(chunk) + (2 if idx else 0)
+                # Everything past the limit is cut anyway, so stop extracting further pages.
+                if total > EXTRACT_TEXT_MAX_CHARS:
+                    break
+        merged = "\n\n".join(chunks)
+        if len(merged) > EXTRACT_TEXT_MAX_CHARS:
+            merged = merged[:EXTRACT_TEXT_MAX_CHARS] + "...(truncated)"
+        return ToolResult(ok=True, content=f"PDF text extracted.\npath={file_path}\n\n{merged}")
+
+    @staticmethod
+    def _write_pdf(file_path: Path, *, title: str, text: str) -> None:
+        try:
+            pdf = PdfTool._build_pdf(title=title, text=text, unicode_enabled=PdfTool._unicode_font_available())
+            pdf.output(str(file_path))
+        except FPDFUnicodeEncodingException:
+            # Last-resort fallback: map unsupported glyphs to latin-1 safe text.
+            pdf = PdfTool._build_pdf(title=title, text=text, unicode_enabled=False)
+            pdf.output(str(file_path))
+
+    @staticmethod
+    def _write_merged_pdf(readers: list[PdfReader], output_path: Path) -> None:
+        writer = PdfWriter()
+        for reader in readers:
+            for page in reader.pages:
+                writer.add_page(page)
+        # pypdf emits each object with many small writes; a large buffer batches them.
+        with output_path.open("wb", buffering=PDF_WRITE_BUFFER_BYTES) as fp:
+            writer.write(fp)
+
     @staticmethod
     def _nano_pdf_command_prefixes() -> list[list[str]]:
         prefixes: list[list[str]] = []
@@ -230,13 +411,7 @@ class PdfTool(BaseTool):
                     proposed_action={"action": action, **args},
                 )
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                pdf = self._build_pdf(title=title, text=text, unicode_enabled=self._unicode_font_available())
-                pdf.output(str(file_path))
-            except FPDFUnicodeEncodingException:
-                # Last-resort fallback: map unsupported glyphs to latin-1 safe text.
-                pdf = self._build_pdf(title=title, text=text, unicode_enabled=False)
-                pdf.output(str(file_path))
+            await asyncio.to_thread(self._write_pdf, file_path, title=title, text=text)
             return ToolResult(ok=True, content=f"PDF created.\npath={file_path}", artifacts=[self._artifact(file_path)])
 
         if action == "inspect":
@@ -250,27 +425,7 @@ class PdfTool(BaseTool):
             if not file_path.exists() or not file_path.is_file():
                 return ToolResult(ok=False, content=f"pdf not found: {file_path}")
 
-            reader = PdfReader(str(file_path))
-            metadata = reader.metadata or {}
-            lines = [f"PDF inspect.\npath={file_path}\npages={len(reader.pages)}"]
-            if metadata:
-                keys = ["/Title", "/Author", "/Creator", "/Producer", "/CreationDate", "/ModDate"]
-                meta_bits = []
-                for key in keys:
-                    value = metadata.get(key)
-                    if value:
-                        meta_bits.append(f"{key[1:].lower()}={value}")
-                if meta_bits:
-                    lines.append("metadata=" + ", ".join(meta_bits))
-
-            previews: list[str] = []
-            for idx, page in enumerate(reader.pages[:3]):
-                text = (page.extract_text() or "").strip()
-                if text:
-                    previews.append(f"page_{idx}_preview={text[:240]}")
-            if previews:
-                lines.extend(previews)
-            return ToolResult(ok=True, content="\n".join(lines))
+            return await asyncio.to_thread(self._inspect_pdf, file_path)
 
         if action == "extract_text":
             raw_path = str(args.get("path") or "").strip()
@@ -282,21 +437,7 @@ class PdfTool(BaseTool):
                 return ToolResult(ok=False, content=f"path rejected: {exc}")
             if not file_path.exists() or not file_path.is_file():
                 return ToolResult(ok=False, content=f"pdf not found: {file_path}")
-            reader = PdfReader(str(file_path))
-            page = args.get("page")
-            if isinstance(page, int):
-                if page < 0 or page >= len(reader.pages):
-                    return ToolResult(ok=False, content=f"page out of range: {page}")
-                text = reader.pages[page].extract_text() or ""
-                return ToolResult(ok=True, content=f"PDF text extracted.\npath={file_path}\npage={page}\n\n{text[:12000]}")
-            chunks: list[str] = []
-            for idx, pdf_page in enumerate(reader.pages):
-                text = pdf_page.extract_text() or ""
-                chunks.append(f"--- page {idx} ---\n{text}")
-            merged = "\n\n".join(chunks)
-            if len(merged) > 12000:
-                merged = merged[:12000] + "...(truncated)"
-            return ToolResult(ok=True, content=f"PDF text extracted.\npath={file_path}\n\n{merged}")
+            return await asyncio.to_thread(self._extract_pdf_text, file_path, args.get("page"))
 
         if action == "merge":
             raw_inputs = _to_path_list(args.get("input_paths"))
@@ -324,13 +465,15 @@ class PdfTool(BaseTool):
                     proposed_action={"action": action, **args},
                 )
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            writer = PdfWriter()
-            for item in input_paths:
-                reader = PdfReader(str(item))
-                for page in reader.pages:
-                    writer.add_page(page)
-            with output_path.open("wb") as fp:
-                writer.write(fp)
+            # Parse the inputs concurrently; pages are still appended in input order below.
+            semaphore = asyncio.Semaphore(MERGE_READ_CONCURRENCY)
+
+            async def _read(item: Path) -> PdfReader:
+                async with semaphore:
+                    return await asyncio.to_thread(PdfReader, str(item))
+
+            readers = await asyncio.gather(*(_read(item) for item in input_paths))
+            await asyncio.to_thread(self._write_merged_pdf, readers, output_path)
             return ToolResult(
                 ok=True,
                 content=f"PDFs merged.\noutput_path={output_path}\ninputs={len(input_paths)}",
@@ -379,60 +522,88 @@ class PdfTool(BaseTool):
                 )
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
+            # nano-pdf edits in place; a distinct output is staged beside the target
+            # and renamed over it only once an attempt verifies.
+            work_path = output_path
             if output_path.resolve() != input_path.resolve():
-                shutil.copy2(input_path, output_path)
-
-            attempts = self._candidate_pages(page, page_index_mode)
-            errors: list[str] = []
-            missing_dependency = True
-            module_missing_error = False
-            non_dependency_error = False
-            command_prefixes = self._nano_pdf_command_prefixes()
-            for candidate in attempts:
-                if candidate < 0:
+                fd, staged = tempfile.mkstemp(
+                    suffix=".pdf", prefix=f".{output_path.stem}.", dir=output_path.parent
+                )
+                os.close(fd)
+                work_path = Path(staged)
+            try:
+                if work_path != output_path:
+                    await asyncio.to_thread(_copy_file, input_path, work_path)
+                return await self._run_nano_pdf_edit(
+                    work_path, output_path, page, page_index_mode, instruction
+                )
+            finally:
+                if work_path != output_path:
+                    work_path.unlink(missing_ok=True)
+
+        return ToolResult(ok=False, content=f"Unsupported action: {action}")
+
+    async def _run_nano_pdf_edit(
+        self,
+        work_path: Path,
+        output_path: Path,
+        page: int,
+        page_index_mode: str,
+        instruction: str,
+    ) -> ToolResult:
+        attempts = self._candidate_pages(page, page_index_mode)
+        errors: list[str] = []
+        missing_dependency = True
+        module_missing_error = False
+        non_dependency_error = False
+        command_prefixes = self._nano_pdf_command_prefixes()
+        for candidate in attempts:
+            if candidate < 0:
+                continue
+            for command_prefix in command_prefixes:
+                cmd = [*command_prefix, "edit", str(work_path), str(candidate), instruction]
+                try:
+                    proc = await asyncio.to_thread(
+                        subprocess.run, cmd, check=False, capture_output=True, text=True
+                    )
+                except FileNotFoundError as exc:
+                    errors.append(f"page={candidate}: dependency not found ({' '.join(command_prefix)})")
                     continue
-                for command_prefix in command_prefixes:
-                    cmd = [*command_prefix, "edit", str(output_path), str(candidate), instruction]
-                    try:
-                        proc = subprocess.run(cmd, check=False, capture_output=True, text=True)
-                    except FileNotFoundError as exc:
-                        errors.append(f"page={candidate}: dependency not found ({' '.join(command_prefix)})")
-                        continue
-                    missing_dependency = False
-                    if proc.returncode != 0:
-                        stderr = (proc.stderr or proc.stdout or "").strip()
-                        lowered = stderr.lower()
-                        if "no module named" in lowered and "nano_pdf" in lowered:
-                            module_missing_error = True
-                        else:
-                            non_dependency_error = True
-                        errors.append(f"page={candidate}: {stderr or 'unknown error'}")
-                        continue
-                    if not self._verify_pdf(output_path):
+                missing_dependency = False
+                if proc.returncode != 0:
+                    stderr = (proc.stderr or proc.stdout or "").strip()
+                    lowered = stderr.lower()
+                    if "no module named" in lowered and "nano_pdf" in lowered:
+                        module_missing_error = True
+                    else:
                         non_dependency_error = True
-                        errors.append(f"page={candidate}: output validation failed")
-                        continue
-                    return ToolResult(
-                        ok=True,
-                        content=(
-                            "PDF page edit complete.\n"
-                            f"output_path={output_path}\n"
-                            f"requested_page={page}\n"
-                            f"applied_page_index={candidate}\n"
-                            f"page_index_mode={page_index_mode}"
-                        ),
-                        artifacts=[self._artifact(output_path)],
-                    )
-
-            if missing_dependency or (module_missing_error and not non_dependency_error):
+                    errors.append(f"page={candidate}: {stderr or 'unknown error'}")
+                    continue
+                if not await asyncio.to_thread(self._verify_pdf, work_path):
+                    non_dependency_error = True
+                    errors.append(f"page={candidate}: output validation failed")
+                    continue
+                if work_path != output_path:
+                    await asyncio.to_thread(os.replace, work_path, output_path)
                 return ToolResult(
-                    ok=False,
+                    ok=True,
                     content=(
-                        "PDF edit dependency is unavailable in runtime. "
-                        "Rebuild/deploy runtime image with nano-pdf."
+                        "PDF page edit complete.\n"
+                        f"output_path={output_path}\n"
+                        f"requested_page={page}\n"
+                        f"applied_page_index={candidate}\n"
+                        f"page_index_mode={page_index_mode}"
                     ),
+                    artifacts=[self._artifact(output_path)],
                 )
-            details = "; ".join(errors) if errors else "unknown error"
-            return ToolResult(ok=False, content=f"nano-pdf edit failed: {details}")
 
-        return ToolResult(ok=False, content=f"Unsupported action: {action}")
+        if missing_dependency or (module_missing_error and not non_dependency_error):
+            return ToolResult(
+                ok=False,
+                content=(
+                    "PDF edit dependency is unavailable in runtime. "
+                    "Rebuild/deploy runtime image with nano-pdf."
+                ),
+            )
+        details = "; ".join(errors) if errors else "unknown error"
+        return ToolResult(ok=False, content=f"nano-pdf edit failed: {details}")
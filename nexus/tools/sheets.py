@@ -6,25 +6,7 @@ from typing import Any
 from nexus.config import Settings
 from nexus.integrations.sheets_client import SheetsClient
 from nexus.tools.base import BaseTool, ToolResult, ToolSpec
-
-
-SCOPE_GUIDANCE = (
-    "Google connection is missing required scopes for this action. "
-    "Disconnect and reconnect Google from the dashboard."
-)
-
-
-def _normalize_google_error(prefix: str, exc: Exception) -> str:
-    message = str(exc)
-    lowered = message.lower()
-    if (
-        "insufficient authentication scopes" in lowered
-        or "insufficientpermissions" in lowered
-        or "insufficient permissions" in lowered
-        or "insufficient permission" in lowered
-    ):
-        return f"{prefix}: {SCOPE_GUIDANCE}"
-    return f"{prefix}: {message}"
+from nexus.tools.google_errors import normalize_google_error
 
 
 def _to_values(value: Any) -> list[list[Any]] | None:
@@ -127,7 +109,7 @@ class SheetsTool(BaseTool):
             try:
                 created = self.client.create_spreadsheet(title=title, sheet_title=sheet_title)
             except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=_normalize_google_error("sheets create failed", exc))
+                return ToolResult(ok=False, content=normalize_google_error("sheets create failed", exc))
 
             spreadsheet_id = str(created.get("spreadsheet_id") or "").strip()
             if not spreadsheet_id:
@@ -148,7 +130,7 @@ class SheetsTool(BaseTool):
                     return ToolResult(
                         ok=False,
                         content=(
-                            f"{_normalize_google_error('sheets create seed failed', exc)}\n"
+                            f"{normalize_google_error('sheets create seed failed', exc)}\n"
                             f"spreadsheet_id={spreadsheet_id}\n"
                             f"seed_range={seed_range}"
                         ),
@@ -235,7 +217,7 @@ class SheetsTool(BaseTool):
                             input_option=input_option,
                         )
                     except Exception as exc:  # noqa: BLE001
-                        return ToolResult(ok=False, content=_normalize_google_error("sheets update failed", exc))
+                        return ToolResult(ok=False, content=normalize_google_error("sheets update failed", exc))
                     return ToolResult(
                         ok=True,
                         content=(
@@ -256,7 +238,7 @@ class SheetsTool(BaseTool):
                         insert_option=insert_option,
                     )
                 except Exception as exc:  # noqa: BLE001
-                    return ToolResult(ok=False, content=_normalize_google_error("sheets append failed", exc))
+                    return ToolResult(ok=False, content=normalize_google_error("sheets append failed", exc))
                 updates = data.get("updates", {})
                 return ToolResult(
                     ok=True,
@@ -271,7 +253,7 @@ class SheetsTool(BaseTool):
             try:
                 data = self.client.clear_values(spreadsheet_id=spreadsheet_id, range_a1=range_a1)
             except Exception as exc:  # noqa: BLE001
-                return ToolResult(ok=False, content=_normalize_google_error("sheets clear failed", exc))
+                return ToolResult(ok=False, content=normalize_google_error("sheets clear failed", exc))
             return ToolResult(ok=True, content=f"Sheets range cleared.\ncleared_range={data.get('clearedRange')}")
 
         return ToolResult(ok=False, content=f"Unsupported action: {action}")
@@ -153,3 +153,47 @@ def test_docs_replace_text_executes_when_confirmed(tmp_path: Path):
     assert result.ok
     assert client.replace_called is True
     assert "occurrences_changed=1" in result.content
+
+
+def test_docs_write_maps_insufficient_scope_errors(tmp_path: Path):
+    class _ScopeErrorClient(_FakeDocsClient):
+        def append_text(self, document_id: str, text: str):
+            raise RuntimeError("HttpError 403: Request had Insufficient Authentication Scopes.")
+
+    tool = DocsTool(_settings(tmp_path), client=_ScopeErrorClient())
+    result = asyncio.run(
+        tool.run(
+            {
+                "action": "append_text",
+                "document_id": "doc-1",
+                "text": " Added line",
+                "confirmed": True,
+            }
+        )
+    )
+    assert not result.ok
+    assert "missing required scopes" in result.content
+
+
+def test_docs_cat_truncates_large_documents(tmp_path: Path):
+    class _LargeDocClient(_FakeDocsClient):
+        def cat_document(self, document_id: str):
+            return {"document_id": document_id, "title": "Big", "text": "  " + "x" * 20000}
+
+    tool = DocsTool(_settings(tmp_path), client=_LargeDocClient())
+    result = asyncio.run(tool.run({"action": "cat", "document_id": "doc-1"}))
+    assert result.ok
+    assert result.content.endswith("x" * 10 + "...(truncated)")
+    assert "x" * 8001 not in result.content
+
+
+def test_docs_cat_does_not_truncate_at_limit_with_trailing_newlines(tmp_path: Path):
+    class _ExactDocClient(_FakeDocsClient):
+        def cat_document(self, document_id: str):
+            return {"document_id": document_id, "title": "Exact", "text": "\n" + "x" * 8000 + "\n\n"}
+
+    tool = DocsTool(_settings(tmp_path), client=_ExactDocClient())
+    result = asyncio.run(tool.run({"action": "cat", "document_id": "doc-1"}))
+    assert result.ok
+    assert "truncated" not in result.content
+    assert "x" * 8000 in result.content
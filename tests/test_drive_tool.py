@@ -8,9 +8,10 @@ from nexus.tools.drive import DriveTool
 
 
 class _FakeDriveClient:
-    def search(self, query: str, max_results: int):
+    def search(self, query: str, max_results: int, fields: str | None = None):
         assert query == "invoice"
         assert max_results == 10
+        assert fields == "files(id,name,mimeType,modifiedTime,webViewLink)"
         return [
             {
                 "id": "file-1",
@@ -88,3 +89,45 @@ def test_drive_upload_executes_when_confirmed(tmp_path: Path):
     )
     assert result.ok
     assert "Drive upload complete." in result.content
+
+
+def test_drive_search_reuses_recent_results(tmp_path: Path):
+    class _CountingDriveClient(_FakeDriveClient):
+        def __init__(self) -> None:
+            self.search_calls = 0
+
+        def search(self, query: str, max_results: int, fields: str | None = None):
+            self.search_calls += 1
+            return super().search(query, max_results, fields)
+
+    client = _CountingDriveClient()
+    tool = DriveTool(_settings(tmp_path), client=client)
+    first = asyncio.run(tool.run({"action": "search", "query": "invoice", "max_results": 10}))
+    second = asyncio.run(tool.run({"action": "search", "query": "invoice", "max_results": 10}))
+    assert first.content == second.content
+    assert client.search_calls == 1
+
+
+def test_drive_search_retries_transient_errors(tmp_path: Path, monkeypatch):
+    class _TransientError(Exception):
+        status_code = 503
+
+    class _FlakyDriveClient(_FakeDriveClient):
+        def __init__(self) -> None:
+            self.search_calls = 0
+
+        def search(self, query: str, max_results: int, fields: str | None = None):
+            self.search_calls += 1
+            if self.search_calls == 1:
+                raise _TransientError("backend unavailable")
+            return super().search(query, max_results, fields)
+
+    async def _no_sleep(_delay: float) -> None:
+        return None
+
+    monkeypatch.setattr("nexus.tools.google_errors.asyncio.sleep", _no_sleep)
+    client = _FlakyDriveClient()
+    tool = DriveTool(_settings(tmp_path), client=client)
+    result = asyncio.run(tool.run({"action": "search", "query": "invoice", "max_results": 10}))
+    assert result.ok
+    assert client.search_calls == 2
@@ -4,6 +4,7 @@ import asyncio
 from pathlib import Path
 
 from nexus.config import Settings
+from nexus.integrations.gmail_client import BatchFetchError
 from nexus.tools.email import EmailTool
 
 
@@ -199,3 +200,46 @@ def test_send_email_attachment_basename_ambiguous_returns_error(tmp_path: Path):
     )
     assert not result.ok
     assert "ambiguous" in result.content.lower()
+
+
+def test_summarize_falls_back_to_concurrent_fetches_when_batch_fails(tmp_path: Path):
+    class _BatchFailingClient(_FakeGmailClient):
+        def list_messages(self, query: str, max_results: int):  # noqa: ANN001
+            raise BatchFetchError("batch endpoint unavailable")
+
+        def list_message_ids(self, query: str, max_results: int):  # noqa: ANN001
+            return ["m1", "m2"]
+
+        def get_message(self, message_id: str):
+            return {"id": message_id, "subject": f"Subject {message_id}", "snippet": ""}
+
+    tool = EmailTool(_settings(tmp_path), client=_BatchFailingClient())
+    result = asyncio.run(tool.run({"action": "summarize_unread"}))
+    assert result.ok
+    assert result.content.index("Subject m1") < result.content.index("Subject m2")
+
+
+def test_send_email_rejects_symlink_escaping_workspace(tmp_path: Path):
+    outside = tmp_path / "secret.txt"
+    outside.write_text("secret", encoding="utf-8")
+    link = tmp_path / "workspace" / "link.txt"
+    link.parent.mkdir(parents=True, exist_ok=True)
+    link.symlink_to(outside)
+
+    client = _FakeGmailClient()
+    tool = EmailTool(_settings(tmp_path), client=client)
+    result = asyncio.run(
+        tool.run(
+            {
+                "action": "send_email",
+                "to": ["a@example.com"],
+                "subject": "Leak",
+                "body_text": "Attached",
+                "attachments": ["link.txt"],
+                "confirmed": True,
+            }
+        )
+    )
+    assert not result.ok
+    assert "escapes workspace" in result.content
+    assert client.sent_payload is None
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from nexus.integrations.excel_recalc import ExcelRecalcEngine
+
+
+def test_formula_scans_stream_every_sheet(tmp_path: Path):
+    workbook_path = tmp_path / "book.xlsx"
+    workbook = Workbook()
+    first = workbook.active
+    first.title = "Data"
+    first["A1"] = "=1/0"
+    first["C4"] = "#DIV/0!"
+    second = workbook.create_sheet("Summary")
+    second["B2"] = "=SUM(Data!A1:A3)"
+    second["D7"] = "#REF!"
+    workbook.save(workbook_path)
+    workbook.close()
+
+    engine = ExcelRecalcEngine()
+    assert engine._count_formulas(workbook_path) == 2
+
+    total, summary = engine._scan_formula_errors(workbook_path)
+    assert total == 2
+    assert summary["#DIV/0!"]["locations"] == ["Data!C4"]
+    assert summary["#REF!"]["locations"] == ["Summary!D7"]
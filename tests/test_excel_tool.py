@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import re
+import subprocess
+import sys
+import zipfile
 from datetime import date, datetime, time, timedelta
 from pathlib import Path
 
-from openpyxl import load_workbook
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.drawing.image import Image
+from openpyxl.styles import Font
 
 from nexus.config import Settings
 from nexus.tools.excel import ExcelTool
@@ -134,6 +141,7 @@ def test_excel_convert_xlsx_to_csv_and_back(tmp_path: Path):
         )
     )
     assert to_csv.ok
+    assert (tmp_path / "workspace" / "book.csv").read_text(encoding="utf-8") == "name,score\nliam,99\n"
 
     to_xlsx = asyncio.run(
         tool.run(
@@ -317,6 +325,32 @@ def test_excel_recalc_validate_action(tmp_path: Path):
     assert "recalc_status=success" in result.content
 
 
+def test_excel_recalc_validate_reuses_report_until_file_changes(tmp_path: Path):
+    recalc = _FakeRecalcEngine()
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=recalc)
+    asyncio.run(tool.run({"action": "create", "path": "cached.xlsx", "confirmed": True}))
+
+    for _ in range(2):
+        result = asyncio.run(tool.run({"action": "recalc_validate", "path": "cached.xlsx", "confirmed": True}))
+        assert result.ok
+    assert len(recalc.calls) == 1
+
+    asyncio.run(
+        tool.run(
+            {
+                "action": "write_cells",
+                "path": "cached.xlsx",
+                "sheet": "Sheet1",
+                "cells": {"A1": 5},
+                "confirmed": True,
+            }
+        )
+    )
+    result = asyncio.run(tool.run({"action": "recalc_validate", "path": "cached.xlsx", "confirmed": True}))
+    assert result.ok
+    assert len(recalc.calls) == 2
+
+
 def test_excel_xlsm_extension_preserved(tmp_path: Path):
     tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
     created = asyncio.run(tool.run({"action": "create", "path": "macro.xlsm", "confirmed": True}))
@@ -336,3 +370,294 @@ def test_excel_xlsm_extension_preserved(tmp_path: Path):
         )
     )
     assert added.ok
+
+
+def test_excel_list_sheets_and_default_read_window(tmp_path: Path, monkeypatch):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "book.xlsx", "sheet_name": "Data", "confirmed": True}))
+    asyncio.run(tool.run({"action": "add_sheet", "path": "book.xlsx", "sheet_name": "Notes", "confirmed": True}))
+    asyncio.run(
+        tool.run(
+            {
+                "action": "append_rows",
+                "path": "book.xlsx",
+                "sheet": "Data",
+                "rows": [["Name", "Score"], ["Liam", 95]],
+                "confirmed": True,
+            }
+        )
+    )
+
+    def _fail_open(*_args, **_kwargs):
+        raise AssertionError("list_sheets should not load the workbook")
+
+    monkeypatch.setattr(tool, "_open_workbook", _fail_open)
+    sheets = asyncio.run(tool.run({"action": "list_sheets", "path": "book.xlsx"}))
+    monkeypatch.undo()
+    assert sheets.ok
+    assert "- Data\n- Notes" in sheets.content
+
+    read = asyncio.run(tool.run({"action": "read", "path": "book.xlsx", "sheet": "Data"}))
+    assert read.ok
+    assert 'values=[["Name","Score"],["Liam",95]]' in read.content
+
+
+def test_excel_read_handles_unsized_worksheet(tmp_path: Path):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "book.xlsx", "confirmed": True}))
+    asyncio.run(
+        tool.run(
+            {
+                "action": "write_cells",
+                "path": "book.xlsx",
+                "cells": {"A1": "Name", "B2": 95},
+                "confirmed": True,
+            }
+        )
+    )
+
+    workbook_path = tmp_path / "workspace" / "book.xlsx"
+    with zipfile.ZipFile(workbook_path) as archive:
+        members = {name: archive.read(name) for name in archive.namelist()}
+    sheet_xml = members["xl/worksheets/sheet1.xml"].decode("utf-8")
+    members["xl/worksheets/sheet1.xml"] = re.sub(r"<dimension [^>]*/>", "", sheet_xml).encode("utf-8")
+    with zipfile.ZipFile(workbook_path, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+
+    read = asyncio.run(tool.run({"action": "read", "path": "book.xlsx"}))
+    assert read.ok
+    assert 'values=[["Name",null],[null,95]]' in read.content
+
+
+def test_excel_write_cells_accepts_absolute_and_lowercase_refs(tmp_path: Path):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "book.xlsx", "confirmed": True}))
+
+    write = asyncio.run(
+        tool.run(
+            {
+                "action": "write_cells",
+                "path": "book.xlsx",
+                "cells": {"$B$3": "abs", "c2": "lower"},
+                "confirmed": True,
+            }
+        )
+    )
+    assert write.ok
+
+    invalid = asyncio.run(
+        tool.run({"action": "write_cells", "path": "book.xlsx", "cells": {"A1:B2": 1}, "confirmed": True})
+    )
+    assert not invalid.ok
+    assert "invalid cell reference" in invalid.content
+
+    wb = load_workbook(tmp_path / "workspace" / "book.xlsx")
+    ws = wb.active
+    assert ws["B3"].value == "abs"
+    assert ws["C2"].value == "lower"
+    wb.close()
+
+
+def test_excel_read_reuses_read_only_handle_until_workbook_changes(tmp_path: Path, monkeypatch):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "book.xlsx", "confirmed": True}))
+    asyncio.run(tool.run({"action": "write_cells", "path": "book.xlsx", "cells": {"A1": "v1"}, "confirmed": True}))
+
+    opened: list[bool] = []
+    original_open = tool._open_workbook
+
+    def _counting_open(file_path, **kwargs):
+        opened.append(bool(kwargs.get("read_only")))
+        return original_open(file_path, **kwargs)
+
+    monkeypatch.setattr(tool, "_open_workbook", _counting_open)
+
+    first = asyncio.run(tool.run({"action": "read", "path": "book.xlsx", "range": "A1"}))
+    sheets = asyncio.run(tool.run({"action": "list_sheets", "path": "book.xlsx"}))
+    assert first.ok and sheets.ok
+    assert opened == [True]
+
+    asyncio.run(tool.run({"action": "write_cells", "path": "book.xlsx", "cells": {"A1": "v2"}, "confirmed": True}))
+    second = asyncio.run(tool.run({"action": "read", "path": "book.xlsx", "range": "A1"}))
+    assert 'values=[["v2"]]' in second.content
+    assert opened == [True, False, True]
+
+
+def test_excel_rejects_oversized_payloads_before_parsing(tmp_path: Path):
+    tool = ExcelTool(
+        _settings(tmp_path, excel_max_json_chars=32, excel_max_write_cells=3),
+        recalc_engine=_FakeRecalcEngine(),
+    )
+    asyncio.run(tool.run({"action": "create", "path": "book.xlsx", "confirmed": True}))
+
+    big_json = asyncio.run(
+        tool.run({"action": "append_rows", "path": "book.xlsx", "rows": "[" + "[1]," * 20 + "[1]]", "confirmed": True})
+    )
+    assert not big_json.ok
+    assert "rows payload too large" in big_json.content
+
+    many_cells = asyncio.run(
+        tool.run(
+            {
+                "action": "write_cells",
+                "path": "book.xlsx",
+                "cells": {"A1": 1, "A2": 2, "A3": 3, "A4": 4},
+                "confirmed": True,
+            }
+        )
+    )
+    assert not many_cells.ok
+    assert "too many cells in one write: 4 (max 3)" in many_cells.content
+
+
+def test_excel_clean_table_normalize_types(tmp_path: Path):
+    csv_path = tmp_path / "workspace" / "types.csv"
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    csv_path.write_text(
+        "amount,when,label\n1,2026-02-18,a\n2x,2026-02-19,b\n3,2026-02-20,c\n4,2026-02-21,d\n5,2026-02-22,e\n",
+        encoding="utf-8",
+    )
+
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    cleaned = asyncio.run(
+        tool.run(
+            {
+                "action": "clean_table",
+                "path": "types.csv",
+                "output_path": "types.xlsx",
+                "normalize_types": True,
+                "confirmed": True,
+            }
+        )
+    )
+    assert cleaned.ok
+
+    wb = load_workbook(tmp_path / "workspace" / "types.xlsx")
+    ws = wb.active
+    assert ws["A2"].value == 1
+    assert ws["A3"].value is None
+    assert isinstance(ws["B2"].value, datetime)
+    assert ws["C2"].value == "a"
+    wb.close()
+
+
+def test_excel_convert_all_sheets_to_csv(tmp_path: Path):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "book.xlsx", "sheet_name": "Data", "confirmed": True}))
+    asyncio.run(tool.run({"action": "add_sheet", "path": "book.xlsx", "sheet_name": "Notes", "confirmed": True}))
+    asyncio.run(
+        tool.run({"action": "write_cells", "path": "book.xlsx", "sheet": "Data", "cells": {"A1": "d"}, "confirmed": True})
+    )
+    asyncio.run(
+        tool.run({"action": "write_cells", "path": "book.xlsx", "sheet": "Notes", "cells": {"A1": "n"}, "confirmed": True})
+    )
+
+    converted = asyncio.run(
+        tool.run({"action": "convert", "path": "book.xlsx", "output_path": "out.csv", "sheet": "*", "confirmed": True})
+    )
+    assert converted.ok
+    assert len(converted.artifacts) == 2
+    workspace = tmp_path / "workspace"
+    assert (workspace / "out-Data.csv").read_text(encoding="utf-8") == "d\n"
+    assert (workspace / "out-Notes.csv").read_text(encoding="utf-8") == "n\n"
+
+
+def test_excel_set_style_preserves_distinct_source_fonts(tmp_path: Path):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "book.xlsx", "confirmed": True}))
+    workbook_path = tmp_path / "workspace" / "book.xlsx"
+    wb = load_workbook(workbook_path)
+    ws = wb.active
+    for ref in ("A1", "B1", "C1"):
+        ws[ref] = ref
+    ws["B1"].font = Font(italic=True)
+    wb.save(workbook_path)
+    wb.close()
+
+    styled = asyncio.run(
+        tool.run(
+            {
+                "action": "set_style",
+                "path": "book.xlsx",
+                "range": "A1:C1",
+                "bold": True,
+                "horizontal": "center",
+                "fill_color": "FFEEEEEE",
+                "confirmed": True,
+            }
+        )
+    )
+    assert styled.ok
+
+    wb = load_workbook(workbook_path)
+    ws = wb.active
+    assert [ws[ref].font.bold for ref in ("A1", "B1", "C1")] == [True, True, True]
+    assert [bool(ws[ref].font.italic) for ref in ("A1", "B1", "C1")] == [False, True, False]
+    assert all(ws[ref].alignment.horizontal == "center" for ref in ("A1", "B1", "C1"))
+    assert all(ws[ref].fill.fgColor.rgb == "FFEEEEEE" for ref in ("A1", "B1", "C1"))
+    wb.close()
+
+
+def test_excel_tool_import_defers_pandas():
+    code = "import sys, nexus.tools.excel; sys.exit('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
+def test_excel_consecutive_edits_keep_embedded_image(tmp_path: Path):
+    pil_image = pytest.importorskip("PIL.Image")
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    picture = tmp_path / "logo.png"
+    pil_image.new("RGB", (4, 4), "red").save(picture)
+    path = tmp_path / "workspace" / "pictured.xlsx"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook = Workbook()
+    workbook.active.add_image(Image(str(picture)), "C3")
+    workbook.save(path)
+
+    written = asyncio.run(
+        tool.run({"action": "write_cells", "path": "pictured.xlsx", "cells": {"A1": 1}, "confirmed": True})
+    )
+    formatted = asyncio.run(
+        tool.run(
+            {"action": "set_number_format", "path": "pictured.xlsx", "range": "A1", "format": "0.00", "confirmed": True}
+        )
+    )
+    assert written.ok and formatted.ok
+    with zipfile.ZipFile(path) as archive:
+        assert any(name.startswith("xl/media/") for name in archive.namelist())
+    assert load_workbook(path).active["A1"].number_format == "0.00"
+
+def test_excel_set_style_alignment_only_leaves_fonts_untouched(tmp_path: Path):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "align.xlsx", "confirmed": True}))
+    path = tmp_path / "workspace" / "align.xlsx"
+    workbook = load_workbook(path)
+    workbook["Sheet1"]["A1"].font = Font(name="Courier New", bold=True)
+    workbook.save(path)
+
+    result = asyncio.run(
+        tool.run({"action": "set_style", "path": "align.xlsx", "range": "A1:B2", "horizontal": "center", "confirmed": True})
+    )
+    assert result.ok
+    ws = load_workbook(path)["Sheet1"]
+    assert ws["A1"].font.name == "Courier New" and ws["A1"].font.bold
+    assert ws["B2"].alignment.horizontal == "center"
+
+
+def test_excel_repeated_style_and_comment_skip_save(tmp_path: Path):
+    tool = ExcelTool(_settings(tmp_path), recalc_engine=_FakeRecalcEngine())
+    asyncio.run(tool.run({"action": "create", "path": "noop.xlsx", "confirmed": True}))
+    path = tmp_path / "workspace" / "noop.xlsx"
+    style = {"action": "set_style", "path": "noop.xlsx", "range": "A1:B2", "bold": True, "fill_color": "FFFF00", "confirmed": True}
+    comment = {"action": "add_comment", "path": "noop.xlsx", "cell": "A1", "comment": "check", "confirmed": True}
+
+    assert "updated=4" in asyncio.run(tool.run(style)).content
+    assert asyncio.run(tool.run(comment)).content.startswith("Comment added.")
+    saved_at = path.stat().st_mtime_ns
+
+    repeat_style = asyncio.run(tool.run(style))
+    repeat_comment = asyncio.run(tool.run(comment))
+    assert repeat_style.ok and "updated=0" in repeat_style.content
+    assert repeat_comment.ok and "no changes saved" in repeat_comment.content
+    assert path.stat().st_mtime_ns == saved_at
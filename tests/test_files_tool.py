@@ -1,5 +1,8 @@
 import asyncio
+import re
+from pathlib import Path
 
+from nexus.tools import files as files_module
 from nexus.tools.files import FileSystemTool
 
 
@@ -34,8 +37,106 @@ def test_filesystem_tool_sandbox_and_confirmation(tmp_path):
     assert "sandbox" in outside.content.lower() or "permission" in outside.content.lower()
 
 
+def test_filesystem_sandbox_rejects_sibling_with_shared_prefix(tmp_path):
+    tool = FileSystemTool(tmp_path / "ws")
+    (tmp_path / "ws2").mkdir()
+    (tmp_path / "ws2" / "secret.txt").write_text("x", encoding="utf-8")
+
+    result = asyncio.run(tool.run({"action": "read_file", "path": str(tmp_path / "ws2" / "secret.txt")}))
+    assert not result.ok
+    assert "sandbox" in result.content.lower()
+
+
 def test_list_dir_empty_is_explicit(tmp_path):
     tool = FileSystemTool(tmp_path)
     result = asyncio.run(tool.run({"action": "list_dir", "path": "."}))
     assert result.ok
     assert "empty" in result.content.lower()
+
+
+def test_grep_search_reports_each_matching_line_once(tmp_path):
+    tool = FileSystemTool(tmp_path)
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "a.txt").write_text("alpha beta\nbeta\n\ngamma alpha alpha\n", encoding="utf-8")
+    (tmp_path / "empty.txt").write_text("", encoding="utf-8")
+    (tmp_path / "many.txt").write_text("alpha\n" * 500, encoding="utf-8")
+    (tmp_path / "notes" / "image.bin").write_bytes(b"\x89PNG\x00\x00alpha\n")
+    (tmp_path / "notes" / ".git").mkdir()
+    (tmp_path / "notes" / ".git" / "HEAD").write_text("alpha\n", encoding="utf-8")
+
+    result = asyncio.run(tool.run({"action": "grep_search", "path": "notes", "pattern": "alpha"}))
+    assert result.ok
+    assert result.content.splitlines() == ["notes/a.txt:1:alpha beta", "notes/a.txt:4:gamma alpha alpha"]
+
+    anchored = asyncio.run(tool.run({"action": "grep_search", "path": "notes", "pattern": "^beta$"}))
+    assert anchored.content == "notes/a.txt:2:beta"
+
+    capped = asyncio.run(tool.run({"action": "grep_search", "pattern": "alpha"}))
+    assert len(capped.content.splitlines()) == 200
+
+
+def test_grep_search_matches_decoded_lines(tmp_path):
+    tool = FileSystemTool(tmp_path)
+    (tmp_path / "crlf.txt").write_bytes(b"hello world\r\nfoo\r\n")
+    (tmp_path / "utf8.txt").write_text("café ok\nfoo\nbar\n", encoding="utf-8")
+
+    def _grep(pattern):
+        return asyncio.run(tool.run({"action": "grep_search", "pattern": pattern})).content.splitlines()
+
+    assert _grep("world$") == ["crlf.txt:1:hello world"]
+    assert _grep(r"caf.\sok") == ["utf8.txt:1:café ok"]
+    assert _grep(r"\u00e9") == ["utf8.txt:1:café ok"]
+    assert sorted(_grep(r"^\w+\s\w+$")) == ["crlf.txt:1:hello world", "utf8.txt:1:café ok"]
+    assert _grep(r"foo\sbar") == ["No matches found"]
+
+
+def test_grep_search_stops_reading_files_at_match_cap(tmp_path, monkeypatch):
+    tool = FileSystemTool(tmp_path)
+    for n in range(30):
+        (tmp_path / f"f{n:02d}.txt").write_text("hit\nmiss\n" * 10, encoding="utf-8")
+    scanned: list[Path] = []
+    original = files_module._grep_file
+
+    def _counting_grep_file(file_path, regex, limit):
+        scanned.append(file_path)
+        return original(file_path, regex, limit)
+
+    monkeypatch.setattr(files_module, "_grep_file", _counting_grep_file)
+    result = asyncio.run(tool.run({"action": "grep_search", "pattern": "hit"}))
+    assert len(result.content.splitlines()) == 200
+    assert len(scanned) == 20
+
+
+def test_grep_search_lists_files_skipped_for_size(tmp_path, monkeypatch):
+    monkeypatch.setattr("nexus.tools.files.GREP_MAX_FILE_BYTES", 1024 * 1024)
+    tool = FileSystemTool(tmp_path)
+    (tmp_path / "big.log").write_text("needle\n" + "x" * (1024 * 1024), encoding="utf-8")
+
+    result = asyncio.run(tool.run({"action": "grep_search", "pattern": "needle"}))
+    assert result.ok
+    assert result.content.splitlines() == ["No matches found", "Skipped 1 file(s) larger than 1 MiB: big.log"]
+
+
+def test_grep_search_caps_skipped_file_list(tmp_path, monkeypatch):
+    monkeypatch.setattr("nexus.tools.files.GREP_MAX_FILE_BYTES", 1024 * 1024)
+    tool = FileSystemTool(tmp_path)
+    for n in range(12):
+        (tmp_path / f"big{n:02d}.log").write_text("x" * (1024 * 1024 + 1), encoding="utf-8")
+
+    result = asyncio.run(tool.run({"action": "grep_search", "pattern": "needle"}))
+    summary = result.content.splitlines()[-1]
+    prefix = "Skipped 12 file(s) larger than 1 MiB: "
+    assert summary.startswith(prefix) and summary.endswith(" ... and 2 more")
+    assert len(summary[len(prefix) : -len(" ... and 2 more")].split(", ")) == 10
+
+
+def test_grep_files_does_not_report_skips_past_match_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr("nexus.tools.files.GREP_MAX_FILE_BYTES", 1024)
+    (tmp_path / "hits.txt").write_text("hit\n" * 200, encoding="utf-8")
+    (tmp_path / "big.log").write_text("hit\n" * 1024, encoding="utf-8")
+
+    found, skipped = files_module._grep_files(
+        [tmp_path / "hits.txt", tmp_path / "big.log"], re.compile("hit"), tmp_path
+    )
+    assert len(found) == 200
+    assert skipped == []
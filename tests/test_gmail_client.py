@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from nexus.config import Settings
+from nexus.integrations.gmail_client import GmailClient
+
+
+class _FakeRequest:
+    def __init__(self, payload: dict) -> None:
+        self.payload = payload
+        self.executed = False
+
+    def execute(self):
+        self.executed = True
+        return self.payload
+
+
+class _FakeBatch:
+    def __init__(self, service: "_FakeService", callback) -> None:  # noqa: ANN001
+        self.service = service
+        self.callback = callback
+        self.requests: list[tuple[str, _FakeRequest]] = []
+
+    def add(self, request: _FakeRequest, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, request.payload, None)
+
+
+class _FakeMessages:
+    def __init__(self, ids: list[str]) -> None:
+        self.ids = ids
+
+    def list(self, **kwargs):  # noqa: ANN003
+        return _FakeRequest({"messages": [{"id": msg_id} for msg_id in self.ids]})
+
+    def get(self, *, userId: str, id: str, format: str, metadataHeaders: list[str]):  # noqa: A002, N803
+        return _FakeRequest(
+            {
+                "id": id,
+                "threadId": f"thr-{id}",
+                "snippet": f"snippet {id}",
+                "payload": {"headers": [{"name": "Subject", "value": f"Subject {id}"}]},
+            }
+        )
+
+
+class _FakeUsers:
+    def __init__(self, ids: list[str]) -> None:
+        self._messages = _FakeMessages(ids)
+
+    def messages(self) -> _FakeMessages:
+        return self._messages
+
+
+class _FakeService:
+    def __init__(self, ids: list[str]) -> None:
+        self._users = _FakeUsers(ids)
+        self.batch_sizes: list[int] = []
+
+    def users(self) -> _FakeUsers:
+        return self._users
+
+    def new_batch_http_request(self, callback):  # noqa: ANN001
+        return _FakeBatch(self, callback)
+
+
+def _settings(tmp_path: Path) -> Settings:
+    return Settings(
+        db_path=tmp_path / "nexus.db",
+        workspace=tmp_path / "workspace",
+        memories_dir=tmp_path / "memories",
+    )
+
+
+def test_list_messages_fetches_metadata_in_batches(tmp_path: Path, monkeypatch):
+    ids = [f"m{idx}" for idx in range(120)]
+    service = _FakeService(ids)
+    client = GmailClient(_settings(tmp_path))
+    monkeypatch.setattr(client, "_service", lambda: service)
+
+    messages = client.list_messages("is:unread", max_results=120)
+
+    assert [msg["id"] for msg in messages] == ids
+    assert messages[0]["subject"] == "Subject m0"
+    assert service.batch_sizes == [100, 20]
+
+
+def test_list_messages_reuses_cached_metadata(tmp_path: Path, monkeypatch):
+    service = _FakeService(["m1", "m2"])
+    client = GmailClient(_settings(tmp_path))
+    monkeypatch.setattr(client, "_service", lambda: service)
+
+    client.list_messages("is:unread", max_results=2)
+    service._users._messages.ids = ["m3", "m1", "m2"]
+    messages = client.list_messages("is:unread", max_results=3)
+
+    assert [msg["id"] for msg in messages] == ["m3", "m1", "m2"]
+    assert service.batch_sizes == [2, 1]
+
+
+def test_send_message_uploads_mime_as_media(tmp_path: Path, monkeypatch):
+    from googleapiclient.discovery import build
+    from googleapiclient.http import HttpMockSequence
+
+    attachment = tmp_path / "report.txt"
+    attachment.write_text("quarterly numbers", encoding="utf-8")
+    http = HttpMockSequence([({"status": "200"}, b'{"id": "sent-1", "threadId": "thr-1"}')])
+    service = build("gmail", "v1", http=http, static_discovery=True)
+    client = GmailClient(_settings(tmp_path))
+    monkeypatch.setattr(client, "_service", lambda: service)
+
+    sent = client.send_message(
+        to=["a@example.com"],
+        cc=None,
+        bcc=None,
+        subject="Report",
+        body_text="Attached",
+        body_html=None,
+        thread_id="thr-1",
+        attachments=[{"path": str(attachment)}],
+    )
+
+    assert sent["id"] == "sent-1"
+    url, _method, body, _headers = http.request_sequence[0]
+    assert "/upload/gmail/v1/users/me/messages/send" in url
+    assert b"Content-Type: message/rfc822" in body
+    assert b'filename="report.txt"' in body
+    assert b'"threadId": "thr-1"' in body
+
+
+def test_service_is_reused_until_token_changes(tmp_path: Path, monkeypatch):
+    import googleapiclient.discovery
+
+    class _Creds:
+        valid = True
+
+    token_path = tmp_path / "token.json"
+    token_path.write_text("{}", encoding="utf-8")
+    settings = _settings(tmp_path)
+    settings.google_token_path = token_path
+    builds: list[object] = []
+
+    def _fake_build(*args, **kwargs):  # noqa: ANN002, ANN003
+        builds.append(object())
+        return builds[-1]
+
+    monkeypatch.setattr("nexus.integrations.gmail_client.load_google_credentials", lambda _settings: _Creds())
+    monkeypatch.setattr(googleapiclient.discovery, "build", _fake_build)
+    client = GmailClient(settings)
+
+    first = client._service()
+    assert client._service() is first
+    token_path.write_text('{"rotated": true}', encoding="utf-8")
+    assert client._service() is not first
+    assert len(builds) == 2
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
 from pathlib import Path
 
+import pytest
+
 from nexus.config import Settings
+from nexus.integrations import openrouter_images
 from nexus.tools.images import ImagesTool
 
 
@@ -140,7 +145,7 @@ def test_images_generate_when_confirmed_with_controls(tmp_path: Path):
     assert client.last_generate["model"] == "google/gemini-2.5-flash-image"
     assert client.last_generate["size"] == "1024x1024"
     assert client.last_generate["resolution"] == "2K"
-    assert client.last_generate["output_path"] == "out/generated.png"
+    assert client.last_generate["output_path"] == str((tmp_path / "workspace" / "out" / "generated.png").resolve())
     assert "generated/images/generated.png" in result.content
 
 
@@ -174,7 +179,8 @@ def test_images_edit_when_confirmed(tmp_path: Path):
     assert client.last_edit is not None
     assert client.last_edit["size"] == "1344x768"
     assert client.last_edit["resolution"] == "1K"
-    assert client.last_edit["output_path"] == "out/edited.png"
+    assert client.last_edit["input_paths"] == [str(source.resolve())]
+    assert client.last_edit["output_path"] == str((tmp_path / "workspace" / "out" / "edited.png").resolve())
     assert "generated/images/edited.png" in result.content
 
 
@@ -212,3 +218,42 @@ def test_images_generate_retries_with_default_model_when_endpoint_missing(tmp_pa
     assert result.ok
     assert client.generate_models == ["moonshotai/kimi-k2.5", "google/gemini-2.5-flash-image"]
     assert "Used `google/gemini-2.5-flash-image` instead." in result.content
+
+
+def test_openrouter_client_decodes_data_url_to_disk_in_chunks(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(openrouter_images, "BASE64_DECODE_CHUNK_CHARS", 8)
+    client = openrouter_images.OpenRouterImageClient(_settings(tmp_path))
+    payload = bytes(range(256)) * 3 + b"tail"
+    encoded = base64.b64encode(payload).decode("ascii")
+
+    saved = client._save_data_url(f"data:image/png;base64,{encoded}", "out/a.png", index=0, total=1)
+    assert Path(saved["path"]).read_bytes() == payload
+
+    wrapped = "\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76))
+    saved = client._save_data_url(f"data:image/png;base64,{wrapped}", "out/b.png", index=0, total=1)
+    assert Path(saved["path"]).read_bytes() == payload
+
+
+def test_openrouter_client_leaves_no_partial_file_for_malformed_payload(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(openrouter_images, "BASE64_DECODE_CHUNK_CHARS", 8)
+    client = openrouter_images.OpenRouterImageClient(_settings(tmp_path))
+    truncated = base64.b64encode(bytes(range(64))).decode("ascii")[:41]
+    out_dir = tmp_path / "workspace" / "out"
+    out_dir.mkdir(parents=True)
+    (out_dir / "existing.png").write_bytes(b"original")
+
+    for name in ("a.png", "existing.png"):
+        with pytest.raises(binascii.Error):
+            client._save_data_url(f"data:image/png;base64,{truncated}", f"out/{name}", index=0, total=1)
+    assert sorted(path.name for path in out_dir.iterdir()) == ["existing.png"]
+    assert (out_dir / "existing.png").read_bytes() == b"original"
+
+def test_openrouter_client_trusts_resolved_output_path_within_workspace(tmp_path: Path, monkeypatch):
+    client = openrouter_images.OpenRouterImageClient(_settings(tmp_path))
+    root = (tmp_path / "workspace").resolve()
+    monkeypatch.setattr(Path, "resolve", lambda self, strict=False: pytest.fail("resolved an absolute output path"))
+
+    target = client._resolve_output_target(str(root / "out" / "a.png"), "image/png", index=0, total=1)
+    assert target == root / "out" / "a.png"
+    with pytest.raises(RuntimeError, match="escapes workspace"):
+        client._resolve_output_target(str(root / ".." / "a.png"), "image/png", index=0, total=1)
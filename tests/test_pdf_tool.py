@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+from pypdf import PageObject, PdfReader
+
 from nexus.config import Settings
-from nexus.tools.pdf import PdfTool
+from nexus.tools.pdf import PdfTool, _copy_file
 
 
 def _settings(tmp_path: Path) -> Settings:
@@ -78,6 +82,8 @@ def test_pdf_merge(tmp_path: Path):
         )
     )
     assert merged.ok
+    reader = PdfReader(str(tmp_path / "workspace" / "merged.pdf"))
+    assert [page.extract_text().strip() for page in reader.pages] == ["A", "B"]
 
 
 def test_pdf_edit_page_nl_auto_fallback_page_index(monkeypatch, tmp_path: Path):
@@ -202,3 +208,135 @@ def test_pdf_edit_page_nl_uses_module_fallback_when_cli_missing(monkeypatch, tmp
     assert result.ok
     assert any(call[0] == "missing-nano-pdf" for call in calls)
     assert any(call[0] == sys.executable and call[1:3] == ["-m", "nano_pdf"] for call in calls)
+
+
+def test_pdf_edit_page_nl_in_place_edits_input_without_copy(monkeypatch, tmp_path: Path):
+    tool = PdfTool(_settings(tmp_path))
+    asyncio.run(tool.run({"action": "create", "path": "a.pdf", "text": "A", "confirmed": True}))
+    monkeypatch.setattr(PdfTool, "_nano_pdf_command_prefixes", staticmethod(lambda: [["nano-pdf"]]))
+    monkeypatch.setattr("nexus.tools.pdf._copy_file", lambda *_: pytest.fail("in-place edit copied the input"))
+
+    targets: list[str] = []
+
+    def fake_run(cmd, check, capture_output, text):  # noqa: ANN001
+        targets.append(cmd[2])
+        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("nexus.tools.pdf.subprocess.run", fake_run)
+    result = asyncio.run(
+        tool.run(
+            {
+                "action": "edit_page_nl",
+                "path": "a.pdf",
+                "page": 1,
+                "instruction": "Change title",
+                "page_index_mode": "zero_based",
+                "confirmed": True,
+            }
+        )
+    )
+    assert result.ok
+    assert targets == [str((tmp_path / "workspace" / "a.pdf").resolve())]
+
+
+def test_pdf_edit_page_nl_failure_leaves_no_output_or_staging_file(monkeypatch, tmp_path: Path):
+    tool = PdfTool(_settings(tmp_path))
+    asyncio.run(tool.run({"action": "create", "path": "a.pdf", "text": "A", "confirmed": True}))
+    monkeypatch.setattr(PdfTool, "_nano_pdf_command_prefixes", staticmethod(lambda: [["nano-pdf"]]))
+
+    def fake_run(cmd, check, capture_output, text):  # noqa: ANN001
+        Path(cmd[2]).write_bytes(b"corrupt")
+        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="bad page")
+
+    monkeypatch.setattr("nexus.tools.pdf.subprocess.run", fake_run)
+    result = asyncio.run(
+        tool.run(
+            {
+                "action": "edit_page_nl",
+                "path": "a.pdf",
+                "output_path": "edited.pdf",
+                "page": 1,
+                "instruction": "Change title",
+                "page_index_mode": "auto",
+                "confirmed": True,
+            }
+        )
+    )
+    assert not result.ok
+    assert sorted(p.name for p in (tmp_path / "workspace").iterdir()) == ["a.pdf"]
+
+
+def test_pdf_text_is_extracted_once_until_file_changes(monkeypatch, tmp_path: Path):
+    tool = PdfTool(_settings(tmp_path))
+    asyncio.run(tool.run({"action": "create", "path": "doc.pdf", "text": "First version", "confirmed": True}))
+
+    calls: list[int] = []
+    original = PageObject.extract_text
+
+    def counting_extract(self, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(PageObject, "extract_text", counting_extract)
+
+    assert asyncio.run(tool.run({"action": "inspect", "path": "doc.pdf"})).ok
+    assert "First version" in asyncio.run(tool.run({"action": "extract_text", "path": "doc.pdf"})).content
+    assert "First version" in asyncio.run(tool.run({"action": "extract_text", "path": "doc.pdf", "page": 0})).content
+    assert len(calls) == 1
+
+    asyncio.run(tool.run({"action": "create", "path": "doc.pdf", "text": "Second version", "confirmed": True}))
+    assert "Second version" in asyncio.run(tool.run({"action": "extract_text", "path": "doc.pdf"})).content
+    assert len(calls) == 2
+
+
+def test_pdf_extract_text_stops_at_truncation_limit(monkeypatch, tmp_path: Path):
+    tool = PdfTool(_settings(tmp_path))
+    asyncio.run(tool.run({"action": "create", "path": "long.pdf", "text": "lorem ipsum " * 10000, "confirmed": True}))
+    page_count = len(PdfReader(str(tmp_path / "workspace" / "long.pdf")).pages)
+
+    calls: list[int] = []
+    original = PageObject.extract_text
+
+    def counting_extract(self, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(PageObject, "extract_text", counting_extract)
+    extracted = asyncio.run(tool.run({"action": "extract_text", "path": "long.pdf"}))
+    assert extracted.ok
+    assert extracted.content.endswith("...(truncated)")
+    assert len(calls) < page_count
+
+
+def test_pdf_pymupdf_backend_matches_pypdf_output(tmp_path: Path):
+    pytest.importorskip("pymupdf")
+    settings = _settings(tmp_path).model_copy(update={"pdf_use_pymupdf": True})
+    tool = PdfTool(settings)
+    asyncio.run(tool.run({"action": "create", "path": "doc.pdf", "title": "Spec", "text": "Hello world", "confirmed": True}))
+
+    inspected = asyncio.run(tool.run({"action": "inspect", "path": "doc.pdf"}))
+    assert inspected.ok
+    assert "pages=1" in inspected.content
+    assert "page_0_preview=Spec" in inspected.content
+
+    extracted = asyncio.run(tool.run({"action": "extract_text", "path": "doc.pdf", "page": 0}))
+    assert extracted.ok
+    assert "Hello world" in extracted.content
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_pdf_copy_file_preserves_bytes_and_mtime(monkeypatch, tmp_path: Path, kernel_copy: bool):
+    if not kernel_copy:
+
+        def unsupported(*_args):  # noqa: ANN002
+            raise OSError("copy_file_range unsupported")
+
+        monkeypatch.setattr("nexus.tools.pdf.os.copy_file_range", unsupported, raising=False)
+    source = tmp_path / "in.pdf"
+    source.write_bytes(b"%PDF-1.4\n" + bytes(range(256)) * 4000)
+    os.utime(source, (1_000_000, 1_000_000))
+
+    target = tmp_path / "out.pdf"
+    _copy_file(source, target)
+    assert target.read_bytes() == source.read_bytes()
+    assert target.stat().st_mtime == source.stat().st_mtime